@@ -11,10 +11,31 @@ Standard fields reference: https://anansi-project.github.io/docs/comicinfo/schem
 
 import re
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
 from utils_compat import sstr
 
 
+def indent_xml(elem, space="  ", level=0):
+    '''
+    Indent an ElementTree in place (ET.indent where available, Python 3.9+).
+
+    elem: XML element
+    '''
+    if hasattr(ET, 'indent'):
+        ET.indent(elem, space=space, level=level)
+        return
+
+    indent = "\n" + level * space
+    if len(elem):
+        if not elem.text or not elem.text.strip():
+            elem.text = indent + space
+        for child in elem:
+            indent_xml(child, space, level + 1)
+        if not child.tail or not child.tail.strip():
+            child.tail = indent
+    if level and (not elem.tail or not elem.tail.strip()):
+        elem.tail = indent
+
+
 class ComicInfoGenerator(object):
     '''
     Generates ComicInfo.xml files from comic book metadata.
@@ -237,9 +258,9 @@ class ComicInfoGenerator(object):
         elem: XML element
         Returns: formatted XML string
         '''
-        rough_string = ET.tostring(elem, encoding='utf-8')
-        reparsed = minidom.parseString(rough_string)
-        return reparsed.toprettyxml(indent='  ', encoding='utf-8').decode('utf-8')
+        indent_xml(elem)
+        return ('<?xml version="1.0" encoding="utf-8"?>\n' +
+                ET.tostring(elem, encoding='unicode') + '\n')
 
     def save_to_file(self, comic_data, filepath):
         '''
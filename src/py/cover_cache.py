@@ -0,0 +1,173 @@
+"""
+Caché en disco de portadas de cómics locales.
+
+Guarda, para cada archivo (ruta, mtime, tamaño), una miniatura PNG de la
+portada y su dHash, de modo que volver a seleccionar un cómic o repetir un
+lote no requiera abrir el archivo ni decodificar la imagen original.
+"""
+import sqlite3
+import os
+import hashlib
+import time
+from io import BytesIO
+from typing import Optional, Tuple
+
+from PIL import Image
+
+
+class CoverCache:
+    """
+    Caché de portadas (miniatura + dHash) en SQLite.
+    La clave incluye mtime y tamaño, así que un archivo modificado invalida
+    automáticamente su entrada.
+    """
+
+    # Tiempo sin acceso tras el que se purgan entradas (en segundos)
+    COVER_CACHE_TTL = 90 * 24 * 60 * 60    # 90 días
+
+    # Modos de imagen que PNG puede guardar sin conversión
+    _PNG_MODES = ('1', 'L', 'LA', 'P', 'RGB', 'RGBA')
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """Inicializar caché."""
+        try:
+            if cache_dir is None:
+                import tempfile
+                if os.name == 'nt':
+                    cache_dir = os.path.join(
+                        os.environ.get('APPDATA', tempfile.gettempdir()),
+                        'TebeoSferaScraper'
+                    )
+                else:
+                    cache_dir = os.path.join(
+                        os.environ.get('XDG_CACHE_HOME',
+                                     os.path.expanduser('~/.cache')),
+                        'tebeosfera-scraper'
+                    )
+            os.makedirs(cache_dir, exist_ok=True)
+            self.db_path = os.path.join(cache_dir, 'covers.db')
+            self._init_database()
+        except Exception as e:
+            # Si falla la inicialización, continuar sin caché
+            import sys
+            print(f"Warning: Cover cache initialization failed: {e}", file=sys.stderr)
+            self.db_path = None
+
+    def _init_database(self):
+        """Crear la tabla de portadas y purgar entradas antiguas."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS covers (
+                    cover_key BLOB PRIMARY KEY,
+                    file_path TEXT NOT NULL,
+                    thumbnail BLOB NOT NULL,
+                    dhash INTEGER,
+                    created_at REAL NOT NULL,
+                    last_accessed REAL NOT NULL
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_covers_path ON covers(file_path)')
+            conn.execute('DELETE FROM covers WHERE last_accessed < ?',
+                         (time.time() - self.COVER_CACHE_TTL,))
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _get_cover_key(filepath: str) -> Optional[bytes]:
+        """Generar clave a partir de ruta, mtime y tamaño del archivo."""
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return None
+        raw = f"{os.path.abspath(filepath)}|{st.st_mtime_ns}|{st.st_size}"
+        return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).digest()
+
+    @staticmethod
+    def _to_signed(value: int) -> int:
+        """SQLite INTEGER es de 64 bits con signo."""
+        return value - (1 << 64) if value >= (1 << 63) else value
+
+    def get_cover(self, filepath: str) -> Optional[Tuple[Image.Image, Optional[int]]]:
+        """Obtener (miniatura, dhash) cacheados, o None si no hay entrada válida."""
+        if self.db_path is None:
+            return None
+        cover_key = self._get_cover_key(filepath)
+        if cover_key is None:
+            return None
+
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                row = conn.execute(
+                    'SELECT thumbnail, dhash FROM covers WHERE cover_key = ?',
+                    (cover_key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute('UPDATE covers SET last_accessed = ? WHERE cover_key = ?',
+                             (time.time(), cover_key))
+                conn.commit()
+            finally:
+                conn.close()
+
+            thumbnail, dhash = row
+            image = Image.open(BytesIO(thumbnail))
+            image.load()
+            if dhash is not None and dhash < 0:
+                dhash += 1 << 64
+            return image, dhash
+        except Exception:
+            return None
+
+    def store_cover(self, filepath: str, image: Image.Image, dhash: Optional[int] = None,
+                    max_size: Tuple[int, int] = (480, 720)) -> Optional[Image.Image]:
+        """Cachear miniatura y dhash de la portada. Devuelve la miniatura."""
+        if self.db_path is None or image is None:
+            return None
+        cover_key = self._get_cover_key(filepath)
+        if cover_key is None:
+            return None
+
+        try:
+            thumbnail = image.copy()
+            if thumbnail.mode not in self._PNG_MODES:
+                thumbnail = thumbnail.convert('RGB')
+            thumbnail.thumbnail(max_size, Image.LANCZOS)
+            buffer = BytesIO()
+            thumbnail.save(buffer, 'PNG')
+
+            now = time.time()
+            conn = sqlite3.connect(self.db_path)
+            try:
+                # Una sola entrada por archivo: descartar versiones anteriores
+                conn.execute('DELETE FROM covers WHERE file_path = ? AND cover_key != ?',
+                             (os.path.abspath(filepath), cover_key))
+                conn.execute('''
+                    INSERT OR REPLACE INTO covers
+                    (cover_key, file_path, thumbnail, dhash, created_at, last_accessed)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', (cover_key, os.path.abspath(filepath), buffer.getvalue(),
+                      self._to_signed(dhash) if dhash is not None else None, now, now))
+                conn.commit()
+            finally:
+                conn.close()
+            return thumbnail
+        except Exception:
+            return None
+
+
+_cover_cache = None
+
+
+def get_cover_cache():
+    '''
+    Get a singleton cover cache instance.
+
+    Returns: CoverCache instance
+    '''
+    global _cover_cache
+    if _cover_cache is None:
+        _cover_cache = CoverCache()
+    return _cover_cache
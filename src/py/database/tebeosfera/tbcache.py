@@ -7,6 +7,7 @@ import os
 import json
 import hashlib
 import time
+import threading
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 import pickle
@@ -484,6 +485,16 @@ class TebeoSferaCache:
         url_hash = self._get_image_key(url)
         now = time.time()
         
+        # Camino rápido: el nombre del archivo sale de la URL, así que una
+        # imagen vigente (según su mtime) se lee sin consultar la base de datos
+        try:
+            file_path = self.image_cache_dir / f"{url_hash}.jpg"
+            if now - file_path.stat().st_mtime <= self.IMAGE_CACHE_TTL:
+                with open(file_path, 'rb') as f:
+                    return f.read()
+        except OSError:
+            pass
+        
         try:
             conn = sqlite3.connect(str(self.db_path))
             cursor = conn.cursor()
@@ -536,10 +547,14 @@ class TebeoSferaCache:
         url_hash = self._get_image_key(url)
         now = time.time()
         file_path = self.image_cache_dir / f"{url_hash}.jpg"
+        # Escribir en un temporal y renombrar: otro hilo puede estar leyendo
+        # la misma imagen por el camino rápido de get_cached_image
+        temp_path = self.image_cache_dir / f"{url_hash}.{os.getpid()}.{threading.get_ident()}.tmp"
         
         try:
-            with open(file_path, 'wb') as f:
+            with open(temp_path, 'wb') as f:
                 f.write(image_data)
+            os.replace(temp_path, file_path)
             
             conn = sqlite3.connect(str(self.db_path))
             cursor = conn.cursor()
@@ -553,10 +568,11 @@ class TebeoSferaCache:
             conn.commit()
             conn.close()
         except Exception:
-            try:
-                file_path.unlink(missing_ok=True)
-            except Exception:
-                pass
+            for path in (temp_path, file_path):
+                try:
+                    path.unlink(missing_ok=True)
+                except Exception:
+                    pass
     
     # ========== UTILIDADES ==========
     
@@ -8,6 +8,7 @@ error handling, and session management.
 '''
 
 import time
+import http.client
 import urllib.request
 import urllib.parse
 import urllib.error
@@ -16,6 +17,7 @@ import gzip
 import os
 import ssl
 import tempfile
+import threading
 import traceback
 from utils_compat import sstr
 
@@ -40,6 +42,8 @@ class TebeoSferaConnection(object):
     def __init__(self):
         '''Initialize the connection manager'''
         self.__last_query_time = 0
+        # Requests may come from several threads (parallel cover downloads)
+        self.__rate_lock = threading.Lock()
         self.__session_opener = None
         self.last_request_url = None
         self.last_status_code = None
@@ -53,19 +57,26 @@ class TebeoSferaConnection(object):
         '''Initialize HTTP session with cookies and headers'''
         # Create cookie handler
         cookie_handler = urllib.request.HTTPCookieProcessor()
+        self.__cookie_jar = cookie_handler.cookiejar
         
         handlers = [cookie_handler]
         
         # Create unverified SSL context to avoid certificate errors
+        self.__ssl_context = None
         try:
             ctx = ssl.create_default_context()
             ctx.check_hostname = False
             ctx.verify_mode = ssl.CERT_NONE
             https_handler = urllib.request.HTTPSHandler(context=ctx)
             handlers.append(https_handler)
+            self.__ssl_context = ctx
         except Exception as e:
             print("Warning: Could not setup SSL context: {0}".format(e))
 
+        # Persistent connections for image downloads, by (thread, scheme, host)
+        self.__keepalive_conns = {}
+        self.__keepalive_lock = threading.Lock()
+
         # Create opener with cookie support and SSL handler
         self.__session_opener = urllib.request.build_opener(*handlers)
 
@@ -81,15 +92,17 @@ class TebeoSferaConnection(object):
     def _enforce_rate_limit(self):
         '''
         Enforce rate limiting between queries to be respectful to the server.
+        Each caller reserves the next free slot under the lock and sleeps
+        outside it, so concurrent requests are still spaced out but the
+        previous response can be in flight while the next one waits.
         '''
-        now = time.time()
-        time_since_last = (now - self.__last_query_time) * 1000  # Convert to ms
-
-        if time_since_last < TebeoSferaConnection.__QUERY_DELAY_MS:
-            sleep_time = (TebeoSferaConnection.__QUERY_DELAY_MS - time_since_last) / 1000.0
-            time.sleep(sleep_time)
+        with self.__rate_lock:
+            now = time.time()
+            slot = max(now, self.__last_query_time + TebeoSferaConnection.__QUERY_DELAY_MS / 1000.0)
+            self.__last_query_time = slot
 
-        self.__last_query_time = time.time()
+        if slot > now:
+            time.sleep(slot - now)
 
     def get_page(self, url):
         '''
@@ -591,13 +604,87 @@ class TebeoSferaConnection(object):
         self._enforce_rate_limit()
 
         try:
-            response = self.__session_opener.open(image_url, timeout=TebeoSferaConnection.TIMEOUT_SECS)
-            image_data = response.read()
+            image_data = self._keepalive_get(image_url)
+            if image_data is None:
+                # Redirects go through the full opener, which follows them
+                response = self.__session_opener.open(image_url, timeout=TebeoSferaConnection.TIMEOUT_SECS)
+                image_data = response.read()
             return image_data
         except Exception as e:
             print("Error downloading image: {0}".format(sstr(e)))
             return None
 
+    def _keepalive_get(self, url):
+        '''
+        GET url over a persistent connection (one per thread and host), so
+        consecutive downloads skip the TCP and TLS handshakes; urllib openers
+        close the connection after every response.
+
+        Returns: Response body, or None for a redirect (the caller then
+        retries through the opener, which follows it). Error statuses raise
+        urllib.error.HTTPError, as the opener would.
+        '''
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ('http', 'https'):
+            return None
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        try:
+            path.encode('ascii')
+        except UnicodeEncodeError:
+            return None  # The opener reports it
+
+        # Same headers and cookies the opener would send (no gzip for images)
+        request = urllib.request.Request(url)
+        self.__cookie_jar.add_cookie_header(request)
+        headers = dict(request.unredirected_hdrs)
+        headers['User-Agent'] = TebeoSferaConnection.USER_AGENT
+        headers['Accept-Language'] = 'es-ES,es;q=0.9,en;q=0.8'
+
+        key = (threading.get_ident(), parts.scheme, parts.netloc)
+        while True:
+            with self.__keepalive_lock:
+                conn = self.__keepalive_conns.get(key)
+                reused = conn is not None
+                if conn is None:
+                    if parts.scheme == 'https':
+                        conn = http.client.HTTPSConnection(
+                            parts.netloc, timeout=TebeoSferaConnection.TIMEOUT_SECS,
+                            context=self.__ssl_context)
+                    else:
+                        conn = http.client.HTTPConnection(
+                            parts.netloc, timeout=TebeoSferaConnection.TIMEOUT_SECS)
+                    self.__keepalive_conns[key] = conn
+            try:
+                conn.request('GET', path, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError):
+                self._drop_keepalive(key)
+                if not reused:
+                    raise
+                # Most likely the server closed the idle connection: reconnect
+                continue
+
+            if response.will_close:
+                self._drop_keepalive(key)
+            # Keep the session cookies in step, as the opener's cookie handler does
+            self.__cookie_jar.extract_cookies(response, request)
+            if 300 <= response.status < 400:
+                return None
+            if response.status >= 400:
+                raise urllib.error.HTTPError(url, response.status, response.reason,
+                                             response.msg, None)
+            return body
+
+    def _drop_keepalive(self, key):
+        '''Close and forget a persistent connection'''
+        with self.__keepalive_lock:
+            conn = self.__keepalive_conns.pop(key, None)
+        if conn is not None:
+            conn.close()
+
     def save_image(self, image_url, filepath):
         '''
         Download and save an image to a file.
@@ -633,8 +720,12 @@ class TebeoSferaConnection(object):
 
     def close(self):
         '''Close the connection and clean up resources'''
-        # Nothing to explicitly close with urllib2
-        pass
+        # The urllib opener keeps nothing open; persistent image connections do
+        with self.__keepalive_lock:
+            conns = list(self.__keepalive_conns.values())
+            self.__keepalive_conns.clear()
+        for conn in conns:
+            conn.close()
 
     def get_request_info(self):
         '''Return metadata about the most recent HTTP request'''
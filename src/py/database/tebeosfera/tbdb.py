@@ -7,6 +7,10 @@ the HTML parsing results to the standard Issue and Series model classes.
 @author: Comic Scraper Enhancement Project
 '''
 
+import copy
+import threading
+from collections import OrderedDict
+
 from database.dbmodels import Issue, IssueRef, SeriesRef
 from .tbconnection import TebeoSferaConnection, get_connection, build_issue_url
 from .tbparser import TebeoSferaParser
@@ -25,6 +29,11 @@ class TebeoSferaDB(object):
     compatible with the existing scraper architecture.
     '''
 
+    # Recent searches kept in memory, in front of the disk cache
+    SEARCH_MEMO_SIZE = 32
+    # Recently viewed issue details, likewise
+    ISSUE_MEMO_SIZE = 128
+
     def __init__(self, log_callback=None, cache_dir=None):
         '''
         Initialize the TebeoSfera database adapter
@@ -37,6 +46,11 @@ class TebeoSferaDB(object):
         self.parser = TebeoSferaParser(log_callback=log_callback)
         # Initialize cache if available
         self.cache = TebeoSferaCache(cache_dir) if TebeoSferaCache else None
+        # {normalized query: [SeriesRef]} in LRU order (see search_series)
+        self._search_memo = OrderedDict()
+        self._search_memo_lock = threading.Lock()
+        # {issue_key: Issue} in LRU order (see query_issue_details)
+        self._issue_memo = OrderedDict()
 
     def search_series(self, search_terms):
         '''
@@ -48,12 +62,24 @@ class TebeoSferaDB(object):
         '''
         log.debug("Searching TebeoSfera for: ", search_terms)
 
+        # Same query typed again (or prefetched by a batch): no disk access
+        memo_key = ' '.join(search_terms.lower().split())
+        with self._search_memo_lock:
+            memo_results = self._search_memo.get(memo_key)
+            if memo_results is not None:
+                self._search_memo.move_to_end(memo_key)
+        if memo_results is not None:
+            log.debug(f"✅ Memory hit for search: {search_terms} ({len(memo_results)} results)")
+            # Copies: dialogs set per-result state (e.g. _loading) on the refs
+            return [copy.copy(ref) for ref in memo_results]
+
         # Try to get from cache first
         if self.cache:
             try:
                 cached_results = self.cache.get_cached_search(search_terms)
                 if cached_results is not None:
                     log.debug(f"✅ Cache hit for search: {search_terms} ({len(cached_results)} results)")
+                    self._remember_search(memo_key, cached_results)
                     return cached_results
                 else:
                     log.debug(f"❌ Cache miss for search: {search_terms}")
@@ -171,6 +197,8 @@ class TebeoSferaDB(object):
             sum(1 for r in results if r.get('type') == 'saga')))
         
         # Cache results before returning
+        if series_refs:
+            self._remember_search(memo_key, series_refs)
         if self.cache and series_refs:
             try:
                 self.cache.cache_search(search_terms, series_refs)
@@ -180,6 +208,46 @@ class TebeoSferaDB(object):
         
         return series_refs
 
+    def narrow_recent_search(self, search_terms):
+        '''
+        Filter a remembered search whose query is a prefix of search_terms
+        (e.g. the user typed a few more letters) down to the results whose
+        name contains the new query. Only meant as a provisional answer while
+        search_series runs: the site may match differently (accents, more
+        results than it lists for the shorter query).
+
+        Returns: [SeriesRef] copies, or None if no recent search applies
+        '''
+        memo_key = ' '.join(search_terms.lower().split())
+        with self._search_memo_lock:
+            # Longest remembered query that the new one extends
+            prefix = max((key for key in self._search_memo
+                          if key != memo_key and memo_key.startswith(key)),
+                         key=len, default=None)
+            if prefix is None:
+                return None
+            refs = self._search_memo[prefix]
+        return [copy.copy(ref) for ref in refs
+                if memo_key in ' '.join(ref.series_name_s.lower().split())]
+
+    def _remember_search(self, memo_key, series_refs):
+        '''Keep copies of a search's results in the in-memory LRU'''
+        refs = [copy.copy(ref) for ref in series_refs]
+        with self._search_memo_lock:
+            self._search_memo[memo_key] = refs
+            self._search_memo.move_to_end(memo_key)
+            while len(self._search_memo) > TebeoSferaDB.SEARCH_MEMO_SIZE:
+                self._search_memo.popitem(last=False)
+
+    def _remember_issue(self, issue_key, issue):
+        '''Keep a copy of an issue's details in the in-memory LRU'''
+        issue = copy.deepcopy(issue)
+        with self._search_memo_lock:
+            self._issue_memo[issue_key] = issue
+            self._issue_memo.move_to_end(issue_key)
+            while len(self._issue_memo) > TebeoSferaDB.ISSUE_MEMO_SIZE:
+                self._issue_memo.popitem(last=False)
+
     def query_series_details(self, series_ref):
         '''
         Get detailed information about a series.
@@ -339,11 +407,22 @@ class TebeoSferaDB(object):
         
         log.debug("Querying issue details for: ", issue_key or "unknown")
 
+        # Issue previewed a moment ago (e.g. now being applied): no disk access
+        with self._search_memo_lock:
+            memo_issue = self._issue_memo.get(issue_key)
+            if memo_issue is not None:
+                self._issue_memo.move_to_end(issue_key)
+        if memo_issue is not None:
+            log.debug(f"Memory hit for issue details: {issue_key}")
+            # Callers may edit the Issue (and its lists) they get back
+            return copy.deepcopy(memo_issue)
+
         # Try to get from cache first
         if self.cache:
             cached = self.cache.get_cached_issue_details(issue_key)
             if cached is not None:
                 log.debug(f"Cache hit for issue details: {issue_key}")
+                self._remember_issue(issue_key, cached)
                 return cached
 
         # Fetch the issue page
@@ -384,6 +463,8 @@ class TebeoSferaDB(object):
                 log.debug(f"Error generating/caching XML: {e}")
                 # Cache only the issue if XML generation fails
                 self.cache.cache_issue_details(issue_key, issue, None)
+        if issue_key and issue:
+            self._remember_issue(issue_key, issue)
 
         return issue
 
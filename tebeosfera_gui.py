@@ -22,15 +22,41 @@ import os
 import threading
 import queue
 import re
+import copy
 import shutil
+import struct
 import traceback
 import webbrowser
-from time import strftime
+import xml.etree.ElementTree as ET
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
+from time import strftime, time
 
 TEBEOSFERA_BASE_URL = "https://www.tebeosfera.com"
 
 # UI Constants
 MAX_FILENAME_LENGTH = 60  # Maximum characters for filename display in dialogs
+MAX_QUEUE_MSGS_PER_TICK = 16  # Max background callbacks run per _process_queue tick
+PAGE_PHOTO_CACHE_SIZE = 8  # Rendered pages kept for quick back/forward navigation
+MAX_LOG_LINES = 2000  # Older lines are dropped from the log panel
+MAX_LOG_HISTORY = 20000  # Lines kept for 'Guardar log' (the panel only shows the last ones)
+MAX_PARALLEL_DOWNLOADS = 8  # Cover downloads in flight at once when comparing
+RESULT_ROWS_PER_BATCH = 50  # Search result rows inserted at a time (more on scroll)
+IMAGE_DATA_CACHE_SIZE = 128  # Downloaded cover images kept in memory by the search dialogs
+COMPARE_STATUS_INTERVAL = 0.25  # Seconds between progress updates while downloading covers
+PREVIEW_DEBOUNCE_MS = 80  # Quiet time after a selection change before its cover is loaded
+PREVIEW_PHOTO_CACHE_SIZE = 16  # Scaled preview covers kept per search dialog
+
+# Scored row prefix for the best match (over 60%)
+BEST_MATCH_PREFIX = "⭐ "
+
+# Search result groups, in display order: (type_s, header format taking the count)
+RESULT_GROUP_HEADERS = (
+    ('saga', "🗂️ Sagas ({})"),
+    ('collection', "📚 Colecciones ({})"),
+    ('issue', "📖 Issues ({})"),
+)
 
 # CustomTkinter button color constants
 CTK_BUTTON_ACTIVE_COLOR = ("#3B8ED0", "#1f6aa5")  # Active button color (CTk default blue)
@@ -62,6 +88,7 @@ def set_toggle_button_colors(active_button, inactive_button):
     inactive_button.configure(fg_color=CTK_BUTTON_INACTIVE_COLOR)
 
 
+@lru_cache(maxsize=1024)
 def build_series_url(series_key_or_path, type_s='collection'):
     """Build absolute URL for a series, collection, or saga.
     
@@ -101,6 +128,7 @@ def build_series_url(series_key_or_path, type_s='collection'):
     return f"{TEBEOSFERA_BASE_URL}{path}"
 
 
+@lru_cache(maxsize=1024)
 def build_issue_url(issue_key_or_path):
     """Build absolute URL for an issue."""
     if not issue_key_or_path:
@@ -138,9 +166,13 @@ def resize_image_for_preview(image, max_size):
     new_height = max(1, int(height * scale))
 
     if new_width == width and new_height == height:
-        return image.copy()
+        # Already fits exactly: callers only display the result, no copy needed
+        return image
+
+    # reducing_gap: shrink by an integer factor with the cheap box filter first,
+    # so LANCZOS only runs on an image ~2x the target (no effect when upscaling)
+    return image.resize((new_width, new_height), ANTIALIAS, reducing_gap=2.0)
 
-    return image.resize((new_width, new_height), ANTIALIAS)
 
 # Add src/py to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src', 'py'))
@@ -150,12 +182,28 @@ try:
     import tkinter as tk
     from tkinter import filedialog, messagebox, ttk
     import customtkinter as ctk
-    from PIL import Image, ImageTk
+    from PIL import Image, ImageChops, ImageTk
 except ImportError as e:
     print("Error: This GUI requires tkinter, customtkinter and PIL/Pillow")
     print("Install with: pip install customtkinter pillow")
     sys.exit(1)
 
+
+def _compile_metadata_sections(sections, labels, long_fields, list_fields):
+    '''
+    Precompute the pretty metadata layout: (SECTION HEADER, fields) per
+    section, each field a (key, label, kind) tuple with kind 'long', 'list'
+    or 'plain'
+    '''
+    compiled = []
+    for name, keys in sections.items():
+        fields = tuple((key, labels.get(key, key),
+                        'long' if key in long_fields else 'list' if key in list_fields else 'plain')
+                       for key in keys)
+        compiled.append((name.upper(), fields))
+    return tuple(compiled)
+
+
 # Configure customtkinter appearance only when running as main app
 def _configure_ctk_appearance():
     ctk.set_appearance_mode("light")  # "System", "Dark", "Light"
@@ -194,6 +242,13 @@ SEARCH_PREVIEW_SIZE = (460, 690)
 
 class ToolTip(object):
     '''Create a tooltip for a given widget'''
+
+    # A single tip window is shared by every tooltip and just moved, relabelled
+    # and shown/hidden, instead of building a Toplevel on each hover
+    _shared_window = None
+    _shared_label = None
+    _owner = None
+
     def __init__(self, widget, text='widget info'):
         self.widget = widget
         self.text = text
@@ -226,24 +281,38 @@ class ToolTip(object):
         # Position tooltip near the widget (bottom-right)
         x = self.widget.winfo_rootx() + self.widget.winfo_width() // 2
         y = self.widget.winfo_rooty() + self.widget.winfo_height() + 4
-        self.tipwindow = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)
+        tw = ToolTip._shared_window
+        if tw is None or not tw.winfo_exists():
+            tw = tk.Toplevel(self.widget.winfo_toplevel())
+            tw.withdraw()
+            tw.wm_overrideredirect(True)
+            label = tk.Label(tw, justify=tk.LEFT,
+                            background="#ffffe0", relief=tk.SOLID, borderwidth=1,
+                            font=("Arial", 9, "normal"), padx=8, pady=6)
+            label.pack(ipadx=1)
+            ToolTip._shared_window = tw
+            ToolTip._shared_label = label
+        ToolTip._shared_label.configure(text=self.text)
         tw.wm_geometry("+%d+%d" % (x, y))
-        label = tk.Label(tw, text=self.text, justify=tk.LEFT,
-                        background="#ffffe0", relief=tk.SOLID, borderwidth=1,
-                        font=("Arial", 9, "normal"), padx=8, pady=6)
-        label.pack(ipadx=1)
+        tw.deiconify()
+        tw.lift()
+        ToolTip._owner = self
+        self.tipwindow = tw
 
     def hidetip(self):
         tw = self.tipwindow
         self.tipwindow = None
-        if tw:
-            tw.destroy()
+        # Another tooltip may have taken over the shared window meanwhile
+        if tw and ToolTip._owner is self:
+            ToolTip._owner = None
+            if tw.winfo_exists():
+                tw.withdraw()
 
 
 try:
     from database.tebeosfera.tbdb import TebeoSferaDB
-    from comicinfo_xml import ComicInfoGenerator
+    from comicinfo_xml import ComicInfoGenerator, indent_xml
+    from cover_cache import get_cover_cache
     import zipfile
     import tempfile
     from io import BytesIO
@@ -251,10 +320,37 @@ except ImportError as e:
     print("Error importing modules: {0}".format(e))
     sys.exit(1)
 
-try:
-    import rarfile
-except ImportError:
-    rarfile = None
+# rarfile is optional and only needed for CBR files: imported on first use
+_rarfile = None
+_rarfile_loaded = False
+
+
+def _shutdown_executor(pool):
+    '''
+    Shut a thread pool down without waiting, cancelling the work still
+    queued: the interpreter joins pool workers at exit, and would
+    otherwise run every queued item first
+    '''
+    if pool is None:
+        return
+    try:
+        pool.shutdown(wait=False, cancel_futures=True)
+    except TypeError:
+        # Python < 3.9: no cancel_futures, queued items still run at exit
+        pool.shutdown(wait=False)
+
+
+def _get_rarfile():
+    '''Return the rarfile module (imported lazily), or None if not installed'''
+    global _rarfile, _rarfile_loaded
+    if not _rarfile_loaded:
+        try:
+            import rarfile
+            _rarfile = rarfile
+        except ImportError:
+            _rarfile = None
+        _rarfile_loaded = True
+    return _rarfile
 
 # Compatibility for Image.ANTIALIAS
 try:
@@ -269,6 +365,129 @@ except ImportError:
         ANTIALIAS = Image.LANCZOS
 
 
+# Comic archive extensions (lowercase, with dot)
+_COMIC_EXTS = frozenset({'.cbz', '.cbr'})
+
+
+def iter_comic_files(directory, recursive=True):
+    '''
+    Yield paths of comic files in directory (top-down, like os.walk).
+    os.scandir entries carry their file type, so no extra stat per file.
+    '''
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    if os.path.splitext(entry.name)[1].lower() in _COMIC_EXTS:
+                        yield entry.path
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+    except OSError:
+        # Unreadable directory: skip it, as os.walk does
+        return
+
+    for subdir in subdirs:
+        yield from iter_comic_files(subdir, True)
+
+
+def _strip_zip64_extra(extra):
+    '''Drop ZIP64 records (id 0x0001) from a ZIP extra field'''
+    out = []
+    i = 0
+    while i + 4 <= len(extra):
+        header_id, size = struct.unpack('<HH', extra[i:i + 4])
+        if header_id != 1:
+            out.append(extra[i:i + 4 + size])
+        i += 4 + size
+    return b''.join(out)
+
+
+def _copy_bytes(src, dst, count, length=1024 * 1024):
+    '''
+    Copy count bytes from the current position of file src to that of dst,
+    returning how many were copied (fewer only if src ends first).
+    Uses os.copy_file_range (Linux, Python 3.8+) when both are real files, so
+    the data never passes through user space; otherwise a buffered loop.
+    '''
+    copied = 0
+    copy_range = getattr(os, 'copy_file_range', None)
+    if copy_range is not None:
+        try:
+            src_fd, dst_fd = src.fileno(), dst.fileno()
+            dst.flush()
+            src_pos, dst_pos = src.tell(), dst.tell()
+        except (OSError, ValueError):
+            copy_range = None
+    if copy_range is not None:
+        # Explicit offsets: neither descriptor position moves, the buffered
+        # objects are re-synced with seek() afterwards
+        try:
+            while copied < count:
+                n = copy_range(src_fd, dst_fd, count - copied,
+                               src_pos + copied, dst_pos + copied)
+                if not n:
+                    break
+                copied += n
+        except OSError:
+            pass  # Not supported here (filesystem, kernel): finish below
+        src.seek(src_pos + copied)
+        dst.seek(dst_pos + copied)
+
+    while copied < count:
+        chunk = src.read(min(length, count - copied))
+        if not chunk:
+            break
+        dst.write(chunk)
+        copied += len(chunk)
+    return copied
+
+
+def _copy_raw_entry(zip_in, zip_out, item, length=1024 * 1024):
+    '''
+    Copy an entry between open ZipFiles without decompressing, recompressing
+    or re-checksumming it: the bytes are copied as stored, and CRC and sizes
+    come from the source entry. Not for encrypted entries.
+    '''
+    fp = zip_in.fp
+    fp.seek(item.header_offset)
+    header = fp.read(zipfile.sizeFileHeader)
+    if len(header) != zipfile.sizeFileHeader or header[:4] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile("Bad local file header for {0}".format(item.filename))
+    # The local header has its own name/extra lengths (may differ from the central directory)
+    name_length, extra_length = struct.unpack('<HH', header[26:30])
+    fp.seek(name_length + extra_length, os.SEEK_CUR)
+
+    zinfo = copy.copy(item)
+    # Sizes are known up front, so no trailing data descriptor; FileHeader()
+    # and the central directory add their own ZIP64 records when needed
+    zinfo.flag_bits &= ~0x08
+    zinfo.extra = _strip_zip64_extra(item.extra)
+    zinfo.header_offset = zip_out.fp.tell()
+    zip_out.fp.write(zinfo.FileHeader(zinfo.file_size > zipfile.ZIP64_LIMIT or
+                                      zinfo.compress_size > zipfile.ZIP64_LIMIT))
+
+    if _copy_bytes(fp, zip_out.fp, item.compress_size, length) != item.compress_size:
+        raise zipfile.BadZipFile("Truncated data for {0}".format(item.filename))
+
+    zip_out.start_dir = zip_out.fp.tell()
+    zip_out.filelist.append(zinfo)
+    zip_out.NameToInfo[zinfo.filename] = zinfo
+    zip_out._didModify = True
+
+
+# Precompiled patterns for extract_title_from_filename
+_RE_BRACKETS = re.compile(r'\[.*?\]')
+_RE_PARENS = re.compile(r'\(.*?\)')
+_RE_LEAD_NUM = re.compile(r'^\d+[.\s\-_]+')
+_RE_TAIL_NUM1 = re.compile(r'[#\s]*\d+[.\d]*\s*$')
+_RE_TAIL_NUM2 = re.compile(r'[#\s]*\d+[.\d]*\s*[-_]\s*.*$')
+_RE_YEAR = re.compile(r'\b(?:19|20)\d{2}\b')
+_RE_SEP = re.compile(r'[_\-.]')
+_RE_WS = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=4096)
 def extract_title_from_filename(filename):
     '''
     Extract series title from filename using improved parsing.
@@ -279,25 +498,25 @@ def extract_title_from_filename(filename):
     
     # Remove content in brackets and parentheses (tags, metadata, etc.)
     # Examples: [Editorial], (2020), [Digital], (c2c)
-    name = re.sub(r'\[.*?\]', '', name)  # Remove [anything]
-    name = re.sub(r'\(.*?\)', '', name)  # Remove (anything)
+    name = _RE_BRACKETS.sub('', name)  # Remove [anything]
+    name = _RE_PARENS.sub('', name)  # Remove (anything)
     
     # Remove common patterns
     # Remove leading numbers (reading order)
-    name = re.sub(r'^\d+[.\s\-_]+', '', name)
+    name = _RE_LEAD_NUM.sub('', name)
     
     # Remove issue numbers at the end (various formats)
-    name = re.sub(r'[#\s]*\d+[.\d]*\s*$', '', name)
-    name = re.sub(r'[#\s]*\d+[.\d]*\s*[-_]\s*.*$', '', name)
+    name = _RE_TAIL_NUM1.sub('', name)
+    name = _RE_TAIL_NUM2.sub('', name)
     
     # Remove year patterns
-    name = re.sub(r'\b(19|20)\d{2}\b', '', name)
+    name = _RE_YEAR.sub('', name)
     
     # Replace separators with spaces
-    name = re.sub(r'[_\-.]', ' ', name)
+    name = _RE_SEP.sub(' ', name)
     
     # Remove multiple spaces
-    name = re.sub(r'\s+', ' ', name)
+    name = _RE_WS.sub(' ', name)
     
     # Remove trailing/leading separators and numbers
     name = name.strip(' ,-_0123456789')
@@ -305,33 +524,114 @@ def extract_title_from_filename(filename):
     return name.strip() if name.strip() else os.path.splitext(filename)[0]
 
 
+try:
+    _popcount = int.bit_count
+except AttributeError:
+    # Python < 3.10
+    def _popcount(value):
+        return bin(value).count('1')
+
+
 class ImageComparator(object):
     '''Compares images to find visual similarity'''
 
+    # Size every comparison works at (histogram input; dHash shrinks further)
+    COMPARE_SIZE = (100, 100)
+
+    # point() table mapping any non-zero level to a set bit
+    _NONZERO_LUT = [0] + [255] * 255
+
+    @staticmethod
+    def prepare_image(image):
+        '''
+        Reduce a freshly opened image to COMPARE_SIZE RGB, once.
+        For JPEGs draft() lets the decoder skip most of the full-res work.
+        '''
+        image.draft('RGB', (ImageComparator.COMPARE_SIZE[0] * 2,
+                            ImageComparator.COMPARE_SIZE[1] * 2))
+        return image.convert('RGB').resize(ImageComparator.COMPARE_SIZE, ANTIALIAS)
+
+    @staticmethod
+    def _memo(image):
+        '''
+        Per-image cache of derived features (hashes, histogram).
+        Stored on the image itself: PIL images are unhashable and id() values
+        are reused once an image is collected. Reset if the image changes size
+        or mode (e.g. after an in-place thumbnail()).
+        '''
+        stamp = (image.size, image.mode)
+        memo = getattr(image, '_comparator_memo', None)
+        if memo is None or memo.get('stamp') != stamp:
+            memo = {'stamp': stamp}
+            image._comparator_memo = memo
+        return memo
+
     @staticmethod
     def calculate_dhash(image, hash_size=8):
-        '''Calculate difference hash (dHash) for an image'''
+        '''Calculate difference hash (dHash) for an image, packed as integer'''
+        memo = ImageComparator._memo(image)
+        key = ('dhash', hash_size)
+        if key in memo:
+            return memo[key]
+
         # Resize to hash_size + 1 width, hash_size height
         resized = image.convert('L').resize((hash_size + 1, hash_size), ANTIALIAS)
-        pixels = list(resized.getdata())
 
-        # Calculate differences between adjacent pixels
-        difference = []
-        for row in range(hash_size):
-            for col in range(hash_size):
-                pixel_left = pixels[row * (hash_size + 1) + col]
-                pixel_right = pixels[row * (hash_size + 1) + col + 1]
-                difference.append(pixel_left > pixel_right)
+        # One bit per pixel that is brighter than its right neighbour:
+        # subtract() clamps at 0, so non-zero means left > right
+        left = resized.crop((0, 0, hash_size, hash_size))
+        right = resized.crop((1, 0, hash_size + 1, hash_size))
+        bits = ImageChops.subtract(left, right).point(ImageComparator._NONZERO_LUT, '1')
+        value = ImageComparator._pack_bits(bits)
+        memo[key] = value
+        return value
+
+    @staticmethod
+    def calculate_ahash(image, hash_size=8):
+        '''Calculate average hash (aHash) for an image, packed as integer'''
+        memo = ImageComparator._memo(image)
+        key = ('ahash', hash_size)
+        if key in memo:
+            return memo[key]
+
+        resized = image.convert('L').resize((hash_size, hash_size), ANTIALIAS)
+        mean = sum(resized.tobytes()) / float(hash_size * hash_size)
+        bits = resized.point([255 if level > mean else 0 for level in range(256)], '1')
+        value = ImageComparator._pack_bits(bits)
+        memo[key] = value
+        return value
+
+    @staticmethod
+    def _pack_bits(bits):
+        '''
+        Pack a mode '1' image into an integer, row-major, first pixel in the
+        most significant bit. tobytes() already packs 8 pixels per byte, so
+        only the row padding needs dropping.
+        '''
+        width, height = bits.size
+        data = bits.tobytes()
+        if width % 8 == 0:
+            return int.from_bytes(data, 'big')
+        row_bytes = (width + 7) // 8
+        padding = row_bytes * 8 - width
+        value = 0
+        for row in range(0, height * row_bytes, row_bytes):
+            value = (value << width) | (int.from_bytes(data[row:row + row_bytes], 'big') >> padding)
+        return value
 
-        # Convert to hexadecimal hash
-        return difference
+    @staticmethod
+    def calculate_features(image):
+        '''
+        Compute (and memoize on the image) the hashes find_best_match uses,
+        e.g. in a worker thread right after download
+        '''
+        ImageComparator.calculate_dhash(image)
+        ImageComparator.calculate_ahash(image)
 
     @staticmethod
     def hamming_distance(hash1, hash2):
-        '''Calculate Hamming distance between two hashes'''
-        if len(hash1) != len(hash2):
-            return -1
-        return sum(h1 != h2 for h1, h2 in zip(hash1, hash2))
+        '''Calculate Hamming distance between two packed hashes'''
+        return _popcount(hash1 ^ hash2)
 
     @staticmethod
     def compare_images(image1, image2):
@@ -351,7 +651,7 @@ class ImageComparator(object):
             distance = ImageComparator.hamming_distance(hash1, hash2)
 
             # Convert to similarity percentage (lower distance = higher similarity)
-            max_distance = len(hash1)
+            max_distance = 64  # bits in an 8x8 dHash
             similarity = 100.0 * (1.0 - float(distance) / max_distance)
 
             return similarity
@@ -369,51 +669,85 @@ class ImageComparator(object):
             return 0
 
         try:
-            # Convert to RGB and resize to same size
-            img1 = image1.convert('RGB').resize((100, 100), ANTIALIAS)
-            img2 = image2.convert('RGB').resize((100, 100), ANTIALIAS)
-
-            # Get histograms
-            h1 = img1.histogram()
-            h2 = img2.histogram()
-
-            # Calculate correlation (simplified)
-            sum1 = float(sum(h1))
-            sum2 = float(sum(h2))
-
-            if sum1 == 0 or sum2 == 0:
+            h1 = ImageComparator.normalized_histogram(image1)
+            h2 = ImageComparator.normalized_histogram(image2)
+            if h1 is None or h2 is None:
                 return 0
-
-            # Normalize and compare
-            correlation = 0.0
-            for i in range(len(h1)):
-                correlation += min(h1[i] / sum1, h2[i] / sum2)
-
-            return correlation * 100.0
+            return ImageComparator.histogram_similarity(h1, h2)
         except Exception as e:
             print("Error comparing histograms: {0}".format(e))
             return 0
 
     @staticmethod
-    def find_best_match(source_image, candidate_images):
+    def normalized_histogram(image):
+        '''RGB histogram of the image at 100x100, normalized to sum 1 (None if empty)'''
+        memo = ImageComparator._memo(image)
+        if 'histogram' in memo:
+            return memo['histogram']
+
+        # Convert to RGB and resize to same size (prepared images already are)
+        resized = image
+        if image.mode != 'RGB' or image.size != ImageComparator.COMPARE_SIZE:
+            resized = image.convert('RGB').resize(ImageComparator.COMPARE_SIZE, ANTIALIAS)
+        histogram = resized.histogram()
+        total = float(sum(histogram))
+        normalized = [count / total for count in histogram] if total else None
+        memo['histogram'] = normalized
+        return normalized
+
+    @staticmethod
+    def histogram_similarity(hist1, hist2):
+        '''Histogram intersection of two normalized histograms, as 0-100 score'''
+        return sum(map(min, hist1, hist2)) * 100.0
+
+    @staticmethod
+    def find_best_match(source_image, candidate_images, source_hash=None, use_histograms=False):
         '''
         Find the best matching image from a list of candidates
+        source_hash is an optional precomputed dHash (as packed integer)
+        use_histograms selects the old (slower) histogram check instead of aHash
         Returns (best_index, similarity_scores)
         '''
         if not source_image or not candidate_images:
             return -1, []
 
+        # Source features are computed once, not once per candidate
+        try:
+            if source_hash is None:
+                source_hash = ImageComparator.calculate_dhash(source_image)
+            if use_histograms:
+                source_hist = ImageComparator.normalized_histogram(source_image)
+            else:
+                source_ahash = ImageComparator.calculate_ahash(source_image)
+        except Exception as e:
+            print("Error comparing images: {0}".format(e))
+            return -1, []
+
         scores = []
         for candidate in candidate_images:
-            if candidate:
-                # Use dHash as primary method
-                score_dhash = ImageComparator.compare_images(source_image, candidate)
-                # Use histogram as secondary for validation
-                score_hist = ImageComparator.compare_histograms(source_image, candidate)
+            if not candidate:
+                scores.append(0)
+                continue
+            try:
+                # Use dHash as primary method: XOR + popcount on packed hashes
+                distance = ImageComparator.hamming_distance(
+                    source_hash, ImageComparator.calculate_dhash(candidate))
+                score_dhash = 100.0 * (1.0 - distance / 64.0)
+                # Use aHash (or histogram) as secondary for validation
+                if use_histograms:
+                    candidate_hist = ImageComparator.normalized_histogram(candidate)
+                    if source_hist is None or candidate_hist is None:
+                        score_second = 0
+                    else:
+                        score_second = ImageComparator.histogram_similarity(
+                            source_hist, candidate_hist)
+                else:
+                    distance = _popcount(source_ahash ^ ImageComparator.calculate_ahash(candidate))
+                    score_second = 100.0 * (1.0 - distance / 64.0)
                 # Weighted average (dHash is more reliable for similar images)
-                final_score = score_dhash * 0.7 + score_hist * 0.3
-                scores.append(final_score)
-            else:
+                scores.append(score_dhash * 0.7 + score_second * 0.3)
+            except Exception as e:
+                print("Error comparing images: {0}".format(e))
                 scores.append(0)
 
         if not scores:
@@ -423,13 +757,19 @@ class ImageComparator(object):
         return best_index, scores
 
 
+# Sentinel for "not looked up yet" where None is a valid cached value
+_UNSET = object()
+
+
 class ComicFile(object):
     '''Represents a comic file to be scraped'''
 
     def __init__(self, filepath):
         self.filepath = filepath
         self.filename = os.path.basename(filepath)
+        self.ext = os.path.splitext(filepath)[1].lower()  # e.g. '.cbz'
         self.cover_image = None
+        self.cover_hash = None  # dHash of the cover, packed as integer
         self.metadata = None
         self.selected_issue = None
         self.status = 'pending'  # pending, searching, selected, completed, error
@@ -438,67 +778,217 @@ class ComicFile(object):
         self.total_pages = 0
         self.current_page_index = 0
         self.archive_type = None
+        self._archive_handle = None  # Cached ZipFile/RarFile handle, opened lazily
+        self.keep_open = False  # Keep the handle between reads (only the displayed comic)
+        self._lock = threading.RLock()  # Guards the archive handle across worker threads
+        self.comicinfo_xml_cache = _UNSET  # Embedded ComicInfo.xml text (None if absent)
+        self.comicinfo_gen = 0  # Bumped whenever the cached ComicInfo.xml goes stale
+        self._comicinfo_bytes = None  # (metadata, encoded XML) from get_comicinfo_bytes
+        self._browser_url = None  # (metadata, selected_issue, url) from get_browser_url
+
+    def get_comicinfo_bytes(self, generator):
+        '''
+        ComicInfo.xml for the current metadata, encoded as UTF-8.
+        Generated once and reused (e.g. on retries) until metadata is replaced.
+        '''
+        cached = self._comicinfo_bytes
+        if cached is None or cached[0] is not self.metadata:
+            cached = (self.metadata, generator.generate_xml(self.metadata).encode('utf-8'))
+            self._comicinfo_bytes = cached
+        return cached[1]
+
+    def get_browser_url(self):
+        '''
+        TebeoSfera page for this comic (None if unknown), worked out once
+        per metadata/selected issue pair.
+        '''
+        cached = self._browser_url
+        if cached is None or cached[0] is not self.metadata or cached[1] is not self.selected_issue:
+            cached = (self.metadata, self.selected_issue, self._find_browser_url())
+            self._browser_url = cached
+        return cached[2]
+
+    def _find_browser_url(self):
+        '''Page URL from the metadata, else from the selected issue'''
+        if self.metadata:
+            url = self.metadata.get('webpage') or self.metadata.get('webpage_s')
+            if url:
+                return url
+            collection_url = self.metadata.get('collection_url')
+            if collection_url:
+                url = build_series_url(collection_url)
+                if url:
+                    return url
+
+        issue = self.selected_issue
+        if issue:
+            url = build_issue_url(getattr(issue, 'issue_key', None))
+            if url:
+                return url
+            # Fallback to series if available in issue metadata
+            series_key = getattr(issue, 'series_key', None)
+            if series_key:
+                return build_series_url(series_key)
+        return None
+
+    def _open_archive(self):
+        '''Return the cached archive handle, opening it on first use'''
+        if self._archive_handle is None:
+            if self.archive_type == 'zip':
+                self._archive_handle = zipfile.ZipFile(self.filepath, 'r')
+            elif self.archive_type == 'rar' and _get_rarfile():
+                self._archive_handle = _get_rarfile().RarFile(self.filepath, 'r')
+        return self._archive_handle
+
+    def close(self):
+        '''Close the cached archive handle (reopened lazily on next read)'''
+        with self._lock:
+            archive = self._archive_handle
+            self._archive_handle = None
+        if archive is not None:
+            try:
+                archive.close()
+            except Exception:
+                pass
+
+    def set_filepath(self, filepath):
+        '''Point this comic at a different file (e.g. after CBR to CBZ conversion)'''
+        self.close()
+        self.filepath = filepath
+        self.filename = os.path.basename(filepath)
+        self.ext = os.path.splitext(filepath)[1].lower()
+        self.comicinfo_xml_cache = _UNSET
+        self.comicinfo_gen += 1
+        self.archive_type = None
+        self.image_entries = []
+        self.total_pages = 0
+        self.current_page_index = 0
 
     def extract_cover(self):
-        '''Extract the first page (cover) from the comic file'''
-        image = self.get_page_image(0)
-        if image:
-            self.cover_image = image
+        '''
+        Extract the first page (cover), using the on-disk cover cache when
+        possible. The archive is closed afterwards unless keep_open is set:
+        covers are prefetched for the whole list, and an open handle per
+        comic would exhaust file descriptors (and lock the files on Windows).
+        '''
+        with self._lock:
+            try:
+                return self._extract_cover()
+            finally:
+                if not self.keep_open:
+                    self.close()
+
+    def _extract_cover(self):
+        '''extract_cover without closing the archive (caller holds _lock)'''
+        # May already have been prefetched by a background worker
+        if self.cover_image is not None:
+            return self.cover_image
+
+        cover_cache = get_cover_cache()
+        cached = cover_cache.get_cover(self.filepath)
+        if cached:
+            self.cover_image, self.cover_hash = cached
+            return self.cover_image
+
+        # Read page 0 directly so current_page_index is left untouched
+        self.load_image_entries()
+        if not self.image_entries:
+            return None
+        image = self._load_entry_image(self.image_entries[0], MAIN_PREVIEW_SIZE)
+        if image is None:
+            return None
+
+        self.cover_hash = ImageComparator.calculate_dhash(image)
+        # Only comparisons use cover_image (pages are displayed from the archive),
+        # so shrink it in place and let the full-resolution buffer go
+        image.thumbnail(MAIN_PREVIEW_SIZE, ANTIALIAS)
+        self.cover_image = image
+        cover_cache.store_cover(self.filepath, image, self.cover_hash, MAIN_PREVIEW_SIZE)
         return image
 
     def load_image_entries(self):
         '''Load ordered list of image entries inside archive'''
-        if self.image_entries:
-            return
+        with self._lock:
+            if self.image_entries:
+                return
 
-        self.error_msg = None
-        entries = []
+            self.error_msg = None
+            entries = []
 
-        try:
-            if rarfile and self.filepath.lower().endswith('.cbr') and rarfile.is_rarfile(self.filepath):
-                self.archive_type = 'rar'
-                with rarfile.RarFile(self.filepath, 'r') as rf:
-                    entries = [
-                        f for f in rf.namelist()
-                        if f.lower().endswith(('.jpg', '.jpeg', '.png', '.gif'))
-                    ]
-            elif zipfile.is_zipfile(self.filepath):
-                self.archive_type = 'zip'
-                with zipfile.ZipFile(self.filepath, 'r') as zf:
-                    entries = [
-                        f for f in zf.namelist()
-                        if f.lower().endswith(('.jpg', '.jpeg', '.png', '.gif'))
-                    ]
-            else:
-                self.error_msg = "Formato de archivo no soportado"
-                return
+            try:
+                rarfile = _get_rarfile() if self.ext == '.cbr' else None
+                if rarfile and rarfile.is_rarfile(self.filepath):
+                    self.archive_type = 'rar'
+                elif zipfile.is_zipfile(self.filepath):
+                    self.archive_type = 'zip'
+                else:
+                    self.error_msg = "Formato de archivo no soportado"
+                    return
 
-            entries.sort()
-            self.image_entries = entries
-            self.total_pages = len(entries)
-            if not self.total_pages:
-                self.error_msg = "No se encontraron imágenes en el archivo"
-            self.current_page_index = 0
-        except Exception as e:
-            print("Error cargando páginas de {0}: {1}".format(self.filename, e))
-            self.error_msg = "Error cargando páginas: {0}".format(str(e))
-            self.image_entries = []
-            self.total_pages = 0
+                entries = [
+                    f for f in self._open_archive().namelist()
+                    if f.lower().endswith(('.jpg', '.jpeg', '.png', '.gif'))
+                ]
 
-    def _read_image_data(self, entry_name):
-        try:
-            if self.archive_type == 'zip':
-                with zipfile.ZipFile(self.filepath, 'r') as zf:
-                    return zf.read(entry_name)
-            elif self.archive_type == 'rar' and rarfile:
-                with rarfile.RarFile(self.filepath, 'r') as rf:
-                    return rf.read(entry_name)
-        except Exception as e:
-            self.error_msg = "Error leyendo página: {0}".format(str(e))
-        return None
+                entries.sort()
+                self.image_entries = entries
+                self.total_pages = len(entries)
+                if not self.total_pages:
+                    self.error_msg = "No se encontraron imágenes en el archivo"
+                self.current_page_index = 0
+            except Exception as e:
+                print("Error cargando páginas de {0}: {1}".format(self.filename, e))
+                self.error_msg = "Error cargando páginas: {0}".format(str(e))
+                self.image_entries = []
+                self.total_pages = 0
+
+    def _open_entry(self, entry_name):
+        '''Return a file-like object for an archive entry (caller must close it)'''
+        archive = self._open_archive()
+        if archive is None:
+            return None
+        if self.archive_type == 'rar':
+            # rarfile streams compressed entries through an external tool and
+            # restarts it on every backwards seek (PIL seeks while probing)
+            return BytesIO(archive.read(entry_name))
 
-    def get_page_image(self, page_index=None):
-        '''Return PIL image for given page index'''
+        # ZipExtFile streams (and CRC-checks) the entry, no full bytes copy of the page
+        return archive.open(entry_name)
+
+    def _load_entry_image(self, entry_name, target_size=None):
+        '''
+        Decode an archive entry into a fully loaded PIL image.
+        With target_size, JPEGs are decoded at the smallest DCT scale (1/2, 1/4,
+        1/8) that still covers that size, which is much cheaper than a full decode.
+        '''
+        with self._lock:
+            try:
+                fp = self._open_entry(entry_name)
+            except Exception as e:
+                # Drop the handle so the next read starts from a fresh open
+                self.close()
+                self.error_msg = "Error leyendo página: {0}".format(str(e))
+                return None
+            if fp is None:
+                return None
+
+            try:
+                with fp:
+                    image = Image.open(fp)
+                    if target_size:
+                        image.draft('RGB', target_size)
+                    image.load()
+                return image
+            except Exception as e:
+                self.error_msg = "Error abriendo imagen: {0}".format(str(e))
+                return None
+
+    def get_page_image(self, page_index=None, target_size=None):
+        '''
+        Return PIL image for given page index.
+        target_size (optional) allows a reduced decode for display; omit it
+        to get the page at full resolution.
+        '''
         self.load_image_entries()
         if not self.image_entries:
             return None
@@ -508,22 +998,109 @@ class ComicFile(object):
 
         page_index = max(0, min(page_index, len(self.image_entries) - 1))
         entry_name = self.image_entries[page_index]
-        data = self._read_image_data(entry_name)
-        if not data:
-            return None
-
-        try:
-            image = Image.open(BytesIO(data))
+        image = self._load_entry_image(entry_name, target_size)
+        if image is not None:
             self.current_page_index = page_index
-            return image
-        except Exception as e:
-            self.error_msg = "Error abriendo imagen: {0}".format(str(e))
-            return None
+        return image
 
 
 class TebeoSferaGUI(ctk.CTk):
     '''Main GUI application window'''
 
+    # Comprehensive field mapping with emojis for the pretty metadata view
+    _FIELD_LABELS = {
+        # Basic Info
+        'Title': '📖 Título',
+        'Series': '📚 Serie',
+        'Number': '🔢 Número',
+        'Count': '📊 Total números',
+        'Volume': '📙 Volumen',
+        'AlternateSeries': '🔄 Serie alterna',
+        'AlternateNumber': '🔄 Número alterno',
+        'AlternateCount': '🔄 Total alterno',
+        
+        # Story
+        'Summary': '📝 Resumen',
+        'Notes': '📋 Notas',
+        'StoryArc': '📖 Arco argumental',
+        'StoryArcNumber': '📖 Número de arco',
+        'SeriesGroup': '📚 Grupo de series',
+        
+        # Publishing
+        'Publisher': '🏢 Editorial',
+        'Imprint': '🏷️ Sello',
+        'Genre': '🎭 Género',
+        'Tags': '🏷️ Etiquetas',
+        'Web': '🌐 Web',
+        'PageCount': '📄 Páginas',
+        'LanguageISO': '🌍 Idioma',
+        'Format': '📐 Formato',
+        'AgeRating': '🔞 Clasificación',
+        'GTIN': '📘 GTIN (ISBN)',
+        'ISBN': '📘 ISBN',
+        'Binding': '📎 Encuadernación',
+        'Dimensions': '📏 Dimensiones',
+        'LegalDeposit': '📜 Depósito Legal',
+        'Price': '💰 Precio',
+        'OriginalTitle': '📖 Título Original',
+        'OriginalPublisher': '🏢 Editorial Original',
+        
+        # Dates
+        'Year': '📅 Año',
+        'Month': '📅 Mes',
+        'Day': '📅 Día',
+        
+        # People
+        'Writer': '✍️ Guionista',
+        'Penciller': '🖊️ Dibujante',
+        'Inker': '🖋️ Entintador',
+        'Colorist': '🎨 Colorista',
+        'Letterer': '✒️ Letrista',
+        'CoverArtist': '🖼️ Portadista',
+        'Editor': '📝 Editor',
+        'Translator': '🔤 Traductor',
+        
+        # Story elements
+        'Characters': '👤 Personajes',
+        'Teams': '👥 Equipos',
+        'Locations': '📍 Ubicaciones',
+        'MainCharacterOrTeam': '⭐ Personaje/Equipo principal',
+        
+        # Format details
+        'BlackAndWhite': '⚫ Blanco y negro',
+        'Manga': '🇯🇵 Manga',
+        'ScanInformation': '📷 Información de escaneo',
+        'Review': '⭐ Reseña',
+        'CommunityRating': '⭐ Valoración comunitaria',
+    }
+
+    # Fields shown in each section of the pretty metadata view, in order
+    _METADATA_SECTIONS = {
+        'Información básica': ['Title', 'Series', 'Number', 'Count', 'Volume', 
+                               'AlternateSeries', 'AlternateNumber', 'AlternateCount'],
+        'Historia': ['Summary', 'StoryArc', 'StoryArcNumber', 'SeriesGroup', 'Notes'],
+        'Publicación': ['Publisher', 'Imprint', 'Genre', 'Tags', 'Web', 'PageCount', 
+                       'LanguageISO', 'Format', 'AgeRating', 'GTIN', 'ISBN', 'Binding', 
+                       'Dimensions', 'LegalDeposit', 'Price', 'OriginalTitle', 'OriginalPublisher'],
+        'Fecha': ['Year', 'Month', 'Day'],
+        'Equipo creativo': ['Writer', 'Penciller', 'Inker', 'Colorist', 'Letterer', 
+                           'CoverArtist', 'Editor', 'Translator'],
+        'Elementos de la historia': ['Characters', 'Teams', 'Locations', 'MainCharacterOrTeam'],
+        'Detalles': ['BlackAndWhite', 'Manga', 'ScanInformation', 'Review', 'CommunityRating'],
+    }
+    _SECTION_KEYS = frozenset(key for keys in _METADATA_SECTIONS.values() for key in keys)
+
+    # Fields rendered as wrapped paragraphs / as bulleted lists
+    _LONG_FIELDS = frozenset({'Summary', 'Notes', 'Review'})
+    _LIST_FIELDS = frozenset({'Characters', 'Teams', 'Locations', 'Writer', 'Penciller',
+                              'Inker', 'Colorist', 'Letterer', 'CoverArtist', 'Editor', 'Translator'})
+
+    # The above, resolved once for _format_metadata_pretty
+    _PRETTY_SECTIONS = _compile_metadata_sections(_METADATA_SECTIONS, _FIELD_LABELS,
+                                                  _LONG_FIELDS, _LIST_FIELDS)
+    # Values treated as missing
+    _EMPTY_VALUES = frozenset({'-1', 'Unknown', ''})
+
     def __init__(self):
         # Note: appearance mode and theme are now set at module level
         ctk.CTk.__init__(self)
@@ -539,8 +1116,45 @@ class TebeoSferaGUI(ctk.CTk):
         self.comic_files = []
         self.current_comic_index = 0
 
-        # Thread-safe queue for UI updates
-        self.update_queue = queue.Queue()
+        # LRU of rendered pages: (filepath, page, canvas_w, canvas_h) -> PhotoImage
+        self._photo_cache = OrderedDict()
+
+        # Comic whose archive handle is kept open for page navigation (see _set_displayed_comic)
+        self._displayed_comic = None
+
+        # Comics whose ComicInfo.xml is being read on the I/O pool
+        self._comicinfo_loading = set()
+
+        # Canvas item showing the current page (created once, then retargeted)
+        self._page_item = None
+        self._page_message_shown = True  # placeholder text is on the canvas
+
+        # Last values pushed to the page navigation widgets (see _update_page_buttons_state)
+        self._last_prev_state = None
+        self._last_next_state = None
+        self._last_page_info = None
+
+        # Thread-safe queue for UI updates (drained on demand, see _post_ui)
+        self.update_queue = queue.SimpleQueue()  # no task tracking needed
+        self._queue_lock = threading.Lock()
+        self._queue_scheduled = False
+
+        # Log lines waiting to be written to the log panel (see _log)
+        self._log_buf = deque()
+        self._log_history = deque(maxlen=MAX_LOG_HISTORY)
+        self._log_prefix = (0, '')  # (second, "[HH:MM:SS] ") cached by _log
+        self._log_lock = threading.Lock()
+        self._log_flush_scheduled = False
+
+        # Background cover extraction (archive I/O and JPEG decode release the GIL)
+        self._cover_pool = ThreadPoolExecutor(max_workers=4)
+        self._cover_futures = []
+
+        # Other blocking archive/disk work (metadata reads, scans, conversions)
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        self._converting = set()
+        # CBZs being written by _inject_xml_async: a second writer would corrupt them
+        self._injecting = set()
 
         # Create UI first (so log_text is available)
         self._create_menu()
@@ -552,9 +1166,6 @@ class TebeoSferaGUI(ctk.CTk):
         self.db = TebeoSferaDB(log_callback=self._log)
         self.xml_generator = ComicInfoGenerator()
 
-        # Start queue processor
-        self.after(100, self._process_queue)
-
         # Bind close event
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
@@ -563,7 +1174,8 @@ class TebeoSferaGUI(ctk.CTk):
 
     def _check_dependencies(self):
         '''Check for optional dependencies and system tools'''
-        # Check for rarfile and unrar
+        # Check for rarfile and unrar (first import of rarfile happens here)
+        rarfile = _get_rarfile()
         if rarfile:
             # Check if unrar executable is in PATH
             # rarfile needs 'unrar' or 'rar' command line tool
@@ -597,10 +1209,27 @@ class TebeoSferaGUI(ctk.CTk):
                     "Los archivos .cbz funcionarán correctamente."
                 )
                 self._log("⚠️ Advertencia: 'unrar' no encontrado en el sistema.")
-                messagebox.showwarning("Dependencia faltante", msg)
+                self._show_warning_banner(msg)
             else:
                 self._log("✅ Soporte CBR activo (rarfile + unrar detectado)")
 
+    def _show_warning_banner(self, text, timeout_ms=15000):
+        '''Show a dismissable warning banner above the toolbar (non-modal)'''
+        banner = ctk.CTkFrame(self, corner_radius=0, fg_color=self.colors['warning'])
+        banner.pack(side=tk.TOP, fill=tk.X, before=self.toolbar)
+
+        ctk.CTkLabel(banner, text="⚠️ " + text, text_color="white", justify=tk.LEFT,
+                     anchor="w", wraplength=1100).pack(side=tk.LEFT, fill=tk.X, expand=True,
+                                                       padx=10, pady=6)
+        ctk.CTkButton(banner, text="✕", width=28, height=28, fg_color="transparent",
+                      hover_color=self.colors['warning_hover'], text_color="white",
+                      command=banner.destroy).pack(side=tk.RIGHT, padx=6)
+
+        def auto_hide():
+            if banner.winfo_exists():
+                banner.destroy()
+        self.after(timeout_ms, auto_hide)
+
     def _create_menu(self):
         '''Create menu bar'''
         menubar = tk.Menu(self)
@@ -631,6 +1260,7 @@ class TebeoSferaGUI(ctk.CTk):
         '''Create toolbar with quick actions'''
         toolbar = ctk.CTkFrame(self, corner_radius=0, height=50)
         toolbar.pack(side=tk.TOP, fill=tk.X, padx=0, pady=0)
+        self.toolbar = toolbar
         
         # Add padding inside toolbar
         inner_toolbar = ctk.CTkFrame(toolbar, fg_color="transparent")
@@ -684,7 +1314,8 @@ class TebeoSferaGUI(ctk.CTk):
         
         self.compare_covers_var = tk.BooleanVar(value=False)  # Disabled by default (slow)
         cb_covers = ctk.CTkCheckBox(options_frame, text="🖼️ Comparar portadas (muy lento)", 
-                                    variable=self.compare_covers_var)
+                                    variable=self.compare_covers_var,
+                                    command=self._on_compare_covers_toggle)
         cb_covers.pack(side=tk.LEFT, padx=5)
         ToolTip(cb_covers, "Comparar portadas del cómic con las de TebeoSfera para encontrar el mejor match")
 
@@ -860,7 +1491,8 @@ class TebeoSferaGUI(ctk.CTk):
                                        highlightthickness=1,
                                        highlightbackground=self.colors['border'],
                                        highlightcolor=self.colors['primary'],
-                                       padx=8, pady=8)
+                                       padx=8, pady=8,
+                                       undo=False, autoseparators=False, maxundo=0)
         metadata_scrollbar = tk.Scrollbar(metadata_text_frame, command=self.metadata_display.yview, width=12)
         self.metadata_display.config(yscrollcommand=metadata_scrollbar.set, state=tk.DISABLED)
         metadata_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -869,6 +1501,12 @@ class TebeoSferaGUI(ctk.CTk):
         # Store current metadata for toggling
         self.current_metadata_xml = None
         self.current_metadata_dict = None
+        self.current_metadata_tree = None  # Parsed ComicInfo root element
+        # Rendered text for each view mode, built on first display of the current XML
+        self._cached_xml_pretty = None
+        self._cached_pretty_text = None
+        # Which of the two the metadata panel currently holds (see _render_metadata_view)
+        self._metadata_shown = None
 
         # ========== SECCIÓN 3: BOTONES DE ACCIÓN ==========
         button_frame = ctk.CTkFrame(right_frame, fg_color="transparent")
@@ -963,7 +1601,8 @@ class TebeoSferaGUI(ctk.CTk):
                                 highlightthickness=1,
                                 highlightbackground=self.colors['border'],
                                 highlightcolor=self.colors['primary'],
-                                padx=8, pady=8)
+                                padx=8, pady=8,
+                                undo=False, autoseparators=False, maxundo=0)
         self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         log_scrollbar.config(command=self.log_text.yview)
         
@@ -1010,32 +1649,63 @@ class TebeoSferaGUI(ctk.CTk):
 
     def _add_files(self, filepaths):
         '''Add files to the list'''
-        for filepath in filepaths:
-            if filepath.lower().endswith(('.cbz', '.cbr')):
-                comic = ComicFile(filepath)
-                self.comic_files.append(comic)
-                self.file_listbox.insert(tk.END, comic.filename)
+        new_comics = [ComicFile(filepath) for filepath in filepaths
+                      if os.path.splitext(filepath)[1].lower() in _COMIC_EXTS]
+        self.comic_files.extend(new_comics)
+        if new_comics:
+            # One Tcl call for the whole batch instead of one per file
+            self.file_listbox.insert(tk.END, *[comic.filename for comic in new_comics])
 
         self._update_status("{0} comics cargados".format(len(self.comic_files)))
+        self._prefetch_covers(new_comics)
+
+    def _on_compare_covers_toggle(self):
+        '''Start extracting covers in the background once comparison is enabled'''
+        if self.compare_covers_var.get():
+            self._prefetch_covers(self.comic_files)
+
+    def _prefetch_covers(self, comics):
+        '''Extract and hash covers on the worker pool (only when comparison is enabled)'''
+        if not self.compare_covers_var.get():
+            return
+
+        self._cover_futures = [f for f in self._cover_futures if not f.done()]
+        for comic in comics:
+            if comic.cover_image is None:
+                self._cover_futures.append(
+                    self._cover_pool.submit(self._extract_cover_worker, comic))
+
+    def _extract_cover_worker(self, comic):
+        '''Worker: extract cover + dHash, then notify the UI thread'''
+        try:
+            comic.extract_cover()
+        except Exception as e:
+            print("Error extrayendo portada de {0}: {1}".format(comic.filename, e))
+        self._post_ui(lambda: self._on_cover_ready(comic))
+
+    def _on_cover_ready(self, comic):
+        '''Called on the UI thread when a background cover extraction finishes'''
+        if not any(not f.done() for f in self._cover_futures):
+            ready = sum(1 for c in self.comic_files if c.cover_image is not None)
+            self._update_status("🖼️ Portadas preparadas: {0}/{1}".format(
+                ready, len(self.comic_files)))
+
+    def _cancel_cover_prefetch(self):
+        '''Cancel pending background cover extractions'''
+        for future in self._cover_futures:
+            future.cancel()
+        self._cover_futures = []
 
     def _scan_directory(self, directory, recursive=True):
-        '''Scan directory for comic files'''
+        '''Scan directory for comic files (the walk runs on the I/O pool)'''
         self._update_status("Escaneando directorio...")
 
-        comic_files = []
-
-        if recursive:
-            for root, dirs, files in os.walk(directory):
-                for filename in files:
-                    if filename.lower().endswith(('.cbz', '.cbr')):
-                        filepath = os.path.join(root, filename)
-                        comic_files.append(filepath)
-        else:
-            for filename in os.listdir(directory):
-                if filename.lower().endswith(('.cbz', '.cbr')):
-                    filepath = os.path.join(directory, filename)
-                    comic_files.append(filepath)
+        future = self._io_pool.submit(lambda: list(iter_comic_files(directory, recursive)))
+        future.add_done_callback(
+            lambda f: self._post_ui(lambda: self._on_scan_done(f.result())))
 
+    def _on_scan_done(self, comic_files):
+        '''Called on the UI thread with the files found by _scan_directory'''
         if comic_files:
             self._add_files(comic_files)
         else:
@@ -1044,10 +1714,30 @@ class TebeoSferaGUI(ctk.CTk):
     def _clear_list(self):
         '''Clear the file list'''
         if messagebox.askyesno("Confirmar", "¿Limpiar toda la lista de comics?"):
+            self._cancel_cover_prefetch()
+            for comic in self.comic_files:
+                comic.keep_open = False
+                comic.close()
             self.comic_files = []
+            self._displayed_comic = None
+            self._photo_cache.clear()
             self.file_listbox.delete(0, tk.END)
             self._update_status("Lista limpiada")
 
+    def _set_displayed_comic(self, comic):
+        '''
+        Keep only the displayed comic's archive open between page reads;
+        the previously displayed one is closed
+        '''
+        previous = self._displayed_comic
+        if previous is comic:
+            return
+        if previous is not None:
+            previous.keep_open = False
+            previous.close()
+        comic.keep_open = True
+        self._displayed_comic = comic
+
     def _on_file_select(self, event):
         '''Handle file selection in listbox'''
         selection = self.file_listbox.curselection()
@@ -1064,16 +1754,10 @@ class TebeoSferaGUI(ctk.CTk):
         comic = self.comic_files[index]
         comic.current_page_index = 0
         
-        # Load all pages first
-        comic.load_image_entries()
-        self._log(f"📚 Cómic seleccionado: {comic.filename} ({comic.total_pages} páginas)")
-        
-        # Extract cover image if not already extracted
-        if not comic.cover_image:
-            comic.extract_cover()
-        
-        # Display first page (portada)
+        # Display first page (portada); this lists the archive entries on first use.
+        # The cover used for comparison is only extracted when a search needs it.
         self._display_comic_page(comic, 0)
+        self._log(f"📚 Cómic seleccionado: {comic.filename} ({comic.total_pages} páginas)")
         
         # Display existing metadata from file
         self._display_existing_metadata(comic)
@@ -1095,9 +1779,26 @@ class TebeoSferaGUI(ctk.CTk):
         '''Display existing ComicInfo.xml metadata from the comic file'''
         self.metadata_display.config(state=tk.NORMAL)
         self.metadata_display.delete('1.0', tk.END)
+        self._cached_xml_pretty = None
+        self._cached_pretty_text = None
+        self._metadata_shown = None
+        self.current_metadata_tree = None
+
+        # Only read the archive the first time this comic is shown, and never
+        # on the UI thread: show a placeholder and come back when it's loaded
+        if comic.comicinfo_xml_cache is _UNSET:
+            self.current_metadata_xml = None
+            self.current_metadata_dict = None
+            self.metadata_display.insert('1.0', "Cargando metadatos...")
+            self.metadata_display.config(state=tk.DISABLED)
+            # A read already in flight will redisplay the comic when it's done
+            if comic not in self._comicinfo_loading:
+                self._comicinfo_loading.add(comic)
+                self._io_pool.submit(self._load_comicinfo_worker, comic, comic.comicinfo_gen)
+            return
         
         try:
-            metadata_xml = self._extract_comicinfo(comic.filepath)
+            metadata_xml = comic.comicinfo_xml_cache
             
             if metadata_xml:
                 # Store for toggling
@@ -1126,18 +1827,37 @@ class TebeoSferaGUI(ctk.CTk):
         
         self.metadata_display.config(state=tk.DISABLED)
     
+    def _load_comicinfo_worker(self, comic, gen):
+        '''Worker: read the embedded ComicInfo.xml, then hand it to the UI thread'''
+        xml = self._extract_comicinfo(comic.filepath)
+        self._post_ui(lambda: self._on_comicinfo_ready(comic, gen, xml))
+
+    def _on_comicinfo_ready(self, comic, gen, xml):
+        '''Called on the UI thread when a comic's ComicInfo.xml has been read'''
+        self._comicinfo_loading.discard(comic)
+        # Only keep it if the file wasn't replaced or re-pointed meanwhile;
+        # a stale read leaves the cache unset, so redisplaying reads again
+        if gen == comic.comicinfo_gen:
+            comic.comicinfo_xml_cache = xml
+        # The user may have moved on to another comic in the meantime
+        if (0 <= self.current_comic_index < len(self.comic_files)
+                and self.comic_files[self.current_comic_index] is comic):
+            self._display_existing_metadata(comic)
+
     def _parse_comicinfo_xml(self, xml_string):
-        '''Parse ComicInfo.xml to a dictionary'''
-        import xml.etree.ElementTree as ET
+        '''Parse ComicInfo.xml to a dictionary (the tree is kept for the XML view)'''
         metadata = {}
         
         try:
             root = ET.fromstring(xml_string)
-            for child in root:
-                if child.text and child.text.strip():
-                    metadata[child.tag] = child.text.strip()
-        except:
-            pass
+        except ET.ParseError:
+            # Malformed XML: the XML view falls back to the raw text
+            return metadata
+
+        self.current_metadata_tree = root
+        for child in root:
+            if child.text and child.text.strip():
+                metadata[child.tag] = child.text.strip()
         
         return metadata
     
@@ -1158,9 +1878,6 @@ class TebeoSferaGUI(ctk.CTk):
         if not self.current_metadata_xml and not self.current_metadata_dict:
             return
         
-        self.metadata_display.config(state=tk.NORMAL)
-        self.metadata_display.delete('1.0', tk.END)
-        
         # Ensure mode is set to pretty if not explicitly set
         mode = self.metadata_view_mode.get()
         if not mode or mode == "":
@@ -1170,136 +1887,64 @@ class TebeoSferaGUI(ctk.CTk):
         
         if mode == "xml":
             # Show formatted XML
-            import xml.dom.minidom as minidom
-            try:
-                dom = minidom.parseString(self.current_metadata_xml)
-                formatted_xml = dom.toprettyxml(indent="  ")
-                # Remove extra blank lines
-                formatted_xml = '\n'.join([line for line in formatted_xml.split('\n') if line.strip()])
-                self.metadata_display.insert('1.0', formatted_xml)
-            except:
-                # If parsing fails, just show raw XML
-                self.metadata_display.insert('1.0', self.current_metadata_xml)
+            if self._cached_xml_pretty is None:
+                root = self.current_metadata_tree
+                if root is not None:
+                    # Reuse the tree parsed in _parse_comicinfo_xml
+                    indent_xml(root)
+                    self._cached_xml_pretty = ('<?xml version="1.0" ?>\n' +
+                                               ET.tostring(root, encoding='unicode'))
+                else:
+                    # If parsing failed, just show raw XML
+                    self._cached_xml_pretty = self.current_metadata_xml
+            text = self._cached_xml_pretty
         
         else:  # pretty mode
             # Show formatted key-value pairs
-            if self.current_metadata_dict:
-                text = self._format_metadata_pretty(self.current_metadata_dict)
-                self.metadata_display.insert('1.0', text)
-            else:
-                self.metadata_display.insert('1.0', "No se pudieron parsear los metadatos")
-        
+            if self._cached_pretty_text is None:
+                if self.current_metadata_dict:
+                    self._cached_pretty_text = self._format_metadata_pretty(self.current_metadata_dict)
+                else:
+                    self._cached_pretty_text = "No se pudieron parsear los metadatos"
+            text = self._cached_pretty_text
+
+        # Pressing the active view's button again leaves the widget alone;
+        # otherwise swap the text in one Tk operation
+        if text is self._metadata_shown:
+            return
+        self.metadata_display.config(state=tk.NORMAL)
+        self.metadata_display.replace('1.0', tk.END, text)
         self.metadata_display.config(state=tk.DISABLED)
+        self._metadata_shown = text
     
     def _format_metadata_pretty(self, metadata):
         '''Format metadata dictionary for beautiful display with all fields'''
         if not metadata:
             return "No hay metadatos disponibles"
         
-        # Comprehensive field mapping with emojis and organized sections
-        field_labels = {
-            # Basic Info
-            'Title': '📖 Título',
-            'Series': '📚 Serie',
-            'Number': '🔢 Número',
-            'Count': '📊 Total números',
-            'Volume': '📙 Volumen',
-            'AlternateSeries': '🔄 Serie alterna',
-            'AlternateNumber': '🔄 Número alterno',
-            'AlternateCount': '🔄 Total alterno',
-            
-            # Story
-            'Summary': '📝 Resumen',
-            'Notes': '📋 Notas',
-            'StoryArc': '📖 Arco argumental',
-            'StoryArcNumber': '📖 Número de arco',
-            'SeriesGroup': '📚 Grupo de series',
-            
-            # Publishing
-            'Publisher': '🏢 Editorial',
-            'Imprint': '🏷️ Sello',
-            'Genre': '🎭 Género',
-            'Tags': '🏷️ Etiquetas',
-            'Web': '🌐 Web',
-            'PageCount': '📄 Páginas',
-            'LanguageISO': '🌍 Idioma',
-            'Format': '📐 Formato',
-            'AgeRating': '🔞 Clasificación',
-            'GTIN': '📘 GTIN (ISBN)',
-            'ISBN': '📘 ISBN',
-            'Binding': '📎 Encuadernación',
-            'Dimensions': '📏 Dimensiones',
-            'LegalDeposit': '📜 Depósito Legal',
-            'Price': '💰 Precio',
-            'OriginalTitle': '📖 Título Original',
-            'OriginalPublisher': '🏢 Editorial Original',
-            
-            # Dates
-            'Year': '📅 Año',
-            'Month': '📅 Mes',
-            'Day': '📅 Día',
-            
-            # People
-            'Writer': '✍️ Guionista',
-            'Penciller': '🖊️ Dibujante',
-            'Inker': '🖋️ Entintador',
-            'Colorist': '🎨 Colorista',
-            'Letterer': '✒️ Letrista',
-            'CoverArtist': '🖼️ Portadista',
-            'Editor': '📝 Editor',
-            'Translator': '🔤 Traductor',
-            
-            # Story elements
-            'Characters': '👤 Personajes',
-            'Teams': '👥 Equipos',
-            'Locations': '📍 Ubicaciones',
-            'MainCharacterOrTeam': '⭐ Personaje/Equipo principal',
-            
-            # Format details
-            'BlackAndWhite': '⚫ Blanco y negro',
-            'Manga': '🇯🇵 Manga',
-            'ScanInformation': '📷 Información de escaneo',
-            'Review': '⭐ Reseña',
-            'CommunityRating': '⭐ Valoración comunitaria',
-        }
-        
-        # Organize fields into sections
-        sections = {
-            'Información básica': ['Title', 'Series', 'Number', 'Count', 'Volume', 
-                                   'AlternateSeries', 'AlternateNumber', 'AlternateCount'],
-            'Historia': ['Summary', 'StoryArc', 'StoryArcNumber', 'SeriesGroup', 'Notes'],
-            'Publicación': ['Publisher', 'Imprint', 'Genre', 'Tags', 'Web', 'PageCount', 
-                           'LanguageISO', 'Format', 'AgeRating', 'GTIN', 'ISBN', 'Binding', 
-                           'Dimensions', 'LegalDeposit', 'Price', 'OriginalTitle', 'OriginalPublisher'],
-            'Fecha': ['Year', 'Month', 'Day'],
-            'Equipo creativo': ['Writer', 'Penciller', 'Inker', 'Colorist', 'Letterer', 
-                               'CoverArtist', 'Editor', 'Translator'],
-            'Elementos de la historia': ['Characters', 'Teams', 'Locations', 'MainCharacterOrTeam'],
-            'Detalles': ['BlackAndWhite', 'Manga', 'ScanInformation', 'Review', 'CommunityRating'],
-        }
-        
         output = []
+        empty_values = self._EMPTY_VALUES
         
         # Process each section
-        for section_name, field_keys in sections.items():
+        for section_header, fields in self._PRETTY_SECTIONS:
             section_fields = []
-            for key in field_keys:
-                if key in metadata and metadata[key] and str(metadata[key]).strip():
-                    value = str(metadata[key]).strip()
-                    if value and value not in ['-1', 'Unknown', '']:
-                        label = field_labels.get(key, key)
-                        section_fields.append((key, label, value))
+            for key, label, kind in fields:
+                value = metadata.get(key)
+                if value:
+                    value = str(value).strip()
+                    if value not in empty_values:
+                        section_fields.append((kind, label, value))
             
             if section_fields:
                 # Beautiful section header with double underline
                 output.append("")
-                output.append(f"  {section_name.upper()}")
+                output.append(f"  {section_header}")
                 output.append("  " + "═" * 56)
                 output.append("")
                 
-                for key, label, value in section_fields:
+                for kind, label, value in section_fields:
                     # Special formatting for long fields
-                    if key in ['Summary', 'Notes', 'Review']:
+                    if kind == 'long':
                         output.append(f"  {label}")
                         output.append("  " + "─" * 56)
                         # Wrap long text with proper indentation
@@ -1314,8 +1959,7 @@ class TebeoSferaGUI(ctk.CTk):
                         if line:
                             output.append(f"    {line}")
                         output.append("")
-                    elif key in ['Characters', 'Teams', 'Locations', 'Writer', 'Penciller', 
-                                'Inker', 'Colorist', 'Letterer', 'CoverArtist', 'Editor', 'Translator']:
+                    elif kind == 'list':
                         # Format comma-separated lists nicely
                         items = [item.strip() for item in value.split(',') if item.strip()]
                         if items:
@@ -1329,17 +1973,13 @@ class TebeoSferaGUI(ctk.CTk):
                         output.append(f"  {label:<25} {value}")
         
         # Add any remaining fields not in sections
-        processed_keys = set()
-        for section_fields in sections.values():
-            processed_keys.update(section_fields)
-        
         remaining = []
         for key, value in metadata.items():
             # Skip internal keys (those starting with underscore)
             if key.startswith('_'):
                 continue
-            if key not in processed_keys and value and str(value).strip() and str(value).strip() not in ['-1', 'Unknown', '']:
-                label = field_labels.get(key, key)
+            if key not in self._SECTION_KEYS and value and str(value).strip() not in empty_values:
+                label = self._FIELD_LABELS.get(key, key)
                 remaining.append((label, value))
         
         if remaining:
@@ -1359,15 +1999,24 @@ class TebeoSferaGUI(ctk.CTk):
     def _extract_comicinfo(self, filepath):
         '''Extract ComicInfo.xml from CBZ/CBR file'''
         try:
-            if filepath.lower().endswith('.cbz') and zipfile.is_zipfile(filepath):
+            # getinfo() is a dict lookup; namelist() would build a list of every page
+            ext = os.path.splitext(filepath)[1].lower()
+            if ext == '.cbz' and zipfile.is_zipfile(filepath):
                 with zipfile.ZipFile(filepath, 'r') as zf:
-                    if 'ComicInfo.xml' in zf.namelist():
-                        return zf.read('ComicInfo.xml').decode('utf-8')
+                    try:
+                        info = zf.getinfo('ComicInfo.xml')
+                    except KeyError:
+                        return None
+                    return zf.read(info).decode('utf-8')
             
-            elif rarfile and filepath.lower().endswith('.cbr') and rarfile.is_rarfile(filepath):
+            elif ext == '.cbr' and _get_rarfile() and _get_rarfile().is_rarfile(filepath):
+                rarfile = _get_rarfile()
                 with rarfile.RarFile(filepath, 'r') as rf:
-                    if 'ComicInfo.xml' in rf.namelist():
-                        return rf.read('ComicInfo.xml').decode('utf-8')
+                    try:
+                        info = rf.getinfo('ComicInfo.xml')
+                    except rarfile.NoRarEntry:
+                        return None
+                    return rf.read(info).decode('utf-8')
         
         except Exception as e:
             self._log(f"⚠️ Error extrayendo ComicInfo.xml: {e}")
@@ -1376,56 +2025,81 @@ class TebeoSferaGUI(ctk.CTk):
 
     def _display_comic_page(self, comic, page_index=None):
         '''Display a specific page from the selected comic'''
-        image = comic.get_page_image(page_index)
-        if image:
-            # Get canvas actual size
-            self.cover_canvas.update_idletasks()
-            canvas_width = self.cover_canvas.winfo_width()
-            canvas_height = self.cover_canvas.winfo_height()
-            
-            # Use reasonable defaults if canvas not yet sized
-            if canvas_width < 10:
-                canvas_width = 400
-            if canvas_height < 10:
-                canvas_height = 600
-            
-            # Scale image to fit canvas while maintaining aspect ratio
-            img_width, img_height = image.size
-            width_ratio = canvas_width / img_width
-            height_ratio = canvas_height / img_height
-            scale = min(width_ratio, height_ratio)
-            
-            new_width = int(img_width * scale)
-            new_height = int(img_height * scale)
-            
-            display_img = image.resize((new_width, new_height), ANTIALIAS)
-            photo = ImageTk.PhotoImage(display_img)
+        # Get canvas actual size
+        self.cover_canvas.update_idletasks()
+        canvas_width = self.cover_canvas.winfo_width()
+        canvas_height = self.cover_canvas.winfo_height()
+
+        # Use reasonable defaults if canvas not yet sized
+        if canvas_width < 10:
+            canvas_width = 400
+        if canvas_height < 10:
+            canvas_height = 600
+
+        self._set_displayed_comic(comic)
+
+        # Resolve the page index the same way get_page_image does
+        comic.load_image_entries()
+        if page_index is None:
+            page_index = comic.current_page_index
+        if comic.image_entries:
+            page_index = max(0, min(page_index, len(comic.image_entries) - 1))
+
+        # Recently shown pages are reused as-is: no decode, resize or PhotoImage build
+        cache_key = (comic.filepath, page_index, canvas_width, canvas_height)
+        photo = self._photo_cache.get(cache_key)
+        if photo is not None:
+            self._photo_cache.move_to_end(cache_key)
+            comic.current_page_index = page_index
+        else:
+            # Decode no larger than needed to fill the canvas
+            image = comic.get_page_image(page_index, target_size=(canvas_width, canvas_height))
+            if image:
+                # Scale image to fit canvas while maintaining aspect ratio
+                display_img = resize_image_for_preview(image, (canvas_width, canvas_height))
+                photo = ImageTk.PhotoImage(display_img)
+                self._photo_cache[cache_key] = photo
+                if len(self._photo_cache) > PAGE_PHOTO_CACHE_SIZE:
+                    self._photo_cache.popitem(last=False)
+
+        if photo is not None:
+            new_width, new_height = photo.width(), photo.height()
             
             # Center image in canvas
             x_offset = (canvas_width - new_width) // 2
             y_offset = (canvas_height - new_height) // 2
             
-            # Update label with image
-            self.cover_label.config(image=photo, text='')
+            # Keep a reference (needed for image persistence)
             self.cover_label.image = photo
             
-            # Position label centered in canvas
-            self.cover_canvas.delete("all")
-            self.cover_canvas.create_image(x_offset, y_offset, image=photo, anchor=tk.NW)
+            # Reuse the page item: retarget and move it instead of clearing
+            # the canvas and creating a new item on every page turn
+            if self._page_message_shown:
+                self.cover_canvas.delete('placeholder', 'message')
+                self._page_message_shown = False
+            if self._page_item is None:
+                self._page_item = self.cover_canvas.create_image(
+                    x_offset, y_offset, image=photo, anchor=tk.NW)
+            else:
+                self.cover_canvas.itemconfigure(self._page_item, image=photo, state=tk.NORMAL)
+                self.cover_canvas.coords(self._page_item, x_offset, y_offset)
             self.cover_canvas.configure(scrollregion=(0, 0, canvas_width, canvas_height))
         else:
             msg = comic.error_msg if comic.error_msg else 'No se pudo extraer la portada'
-            self.cover_canvas.delete("all")
+            if self._page_item is not None:
+                self.cover_canvas.itemconfigure(self._page_item, state=tk.HIDDEN)
+            self.cover_canvas.delete('placeholder', 'message')
             self.cover_canvas.create_text(
                 self.cover_canvas.winfo_width() // 2 if self.cover_canvas.winfo_width() > 10 else 200,
                 self.cover_canvas.winfo_height() // 2 if self.cover_canvas.winfo_height() > 10 else 300,
-                text=msg, font=('Arial', 12), fill='gray40'
+                text=msg, font=('Arial', 12), fill='gray40', tags='message'
             )
+            self._page_message_shown = True
             self.cover_label.image = None
 
         # Update buttons and page counter
         self._update_page_buttons_state(comic)
-        return image is not None
+        return photo is not None
 
     def _update_page_buttons_state(self, comic):
         '''Update page navigation button states based on current page'''
@@ -1437,26 +2111,30 @@ class TebeoSferaGUI(ctk.CTk):
         
         # Always show the buttons frame and update info
         if hasattr(self, 'page_info_label'):
-            if total > 0:
-                self.page_info_label.configure(text=f"{current + 1}/{total}")
-            else:
-                self.page_info_label.configure(text="0/0")
+            page_info = f"{current + 1}/{total}" if total > 0 else "0/0"
+            if page_info != self._last_page_info:
+                self.page_info_label.configure(text=page_info)
+                self._last_page_info = page_info
         
         # Enable/disable buttons based on page count and position
         if total > 1:
-            # Enable prev if not on first page
-            self.prev_page_button.configure(
-                state=tk.NORMAL if current > 0 else tk.DISABLED)
-            # Enable next if not on last page
-            self.next_page_button.configure(
-                state=tk.NORMAL if current < total - 1 else tk.DISABLED)
-            self._log(f"📖 Navegación habilitada: página {current + 1} de {total}")
+            # Enable prev if not on first page, next if not on last page
+            prev_state = tk.NORMAL if current > 0 else tk.DISABLED
+            next_state = tk.NORMAL if current < total - 1 else tk.DISABLED
         else:
             # Disable both if only 1 or 0 pages
-            self.prev_page_button.configure(state=tk.DISABLED)
-            self.next_page_button.configure(state=tk.DISABLED)
-            if total == 1:
-                self._log(f"ℹ️ Cómic con una sola página - navegación deshabilitada")
+            prev_state = next_state = tk.DISABLED
+
+        # Each configure is a Tcl round-trip: only touch what changed
+        if prev_state != self._last_prev_state:
+            self.prev_page_button.configure(state=prev_state)
+            self._last_prev_state = prev_state
+        if next_state != self._last_next_state:
+            self.next_page_button.configure(state=next_state)
+            self._last_next_state = next_state
+
+        if total == 1:
+            self._log(f"ℹ️ Cómic con una sola página - navegación deshabilitada")
 
     def _show_prev_page(self):
         '''Show previous page of current comic'''
@@ -1515,37 +2193,25 @@ class TebeoSferaGUI(ctk.CTk):
 
         # Generate and inject XML
         try:
-            xml_content = self.xml_generator.generate_xml(comic.metadata)
+            xml_content = comic.get_comicinfo_bytes(self.xml_generator)
 
             # Check if it's CBR
-            if comic.filepath.lower().endswith('.cbr'):
-                if not rarfile:
+            if comic.ext == '.cbr':
+                if not _get_rarfile():
                     messagebox.showerror("Error", "No se puede procesar CBR sin el módulo 'rarfile'")
                     return
 
                 if messagebox.askyesno("Confirmar conversión", 
                                       "El archivo es CBR (RAR). Para inyectar el XML es necesario convertirlo a CBZ (ZIP).\n\n"
                                       "¿Desea convertirlo ahora?\n(Se creará un nuevo archivo .cbz y se eliminará el .cbr)"):
-                    new_path = self._convert_cbr_to_cbz(comic.filepath)
-                    if new_path:
-                        comic.filepath = new_path
-                        comic.filename = os.path.basename(new_path)
-                        self._inject_xml(comic.filepath, xml_content)
-                        # Update listbox
-                        self.file_listbox.delete(self.current_comic_index)
-                        self.file_listbox.insert(self.current_comic_index, comic.filename)
-                        self.file_listbox.selection_set(self.current_comic_index)
-                        
-                        comic.status = 'completed'
-                        messagebox.showinfo("Éxito", "Conversión a CBZ e inyección de XML completada")
-                    else:
-                        comic.status = 'error'
-                        messagebox.showerror("Error", "Falló la conversión a CBZ")
+                    self._convert_cbr_to_cbz_async(
+                        comic.filepath,
+                        lambda new_path: self._on_current_converted(comic, new_path, xml_content))
                 else:
                     return
             else:
                 # Inject into CBZ
-                self._inject_xml(comic.filepath, xml_content)
+                self._inject_xml_now(comic.filepath, xml_content)
                 comic.status = 'completed'
                 messagebox.showinfo("Éxito", "ComicInfo.xml generado e inyectado correctamente")
 
@@ -1553,33 +2219,114 @@ class TebeoSferaGUI(ctk.CTk):
             comic.status = 'error'
             messagebox.showerror("Error", "Error generando XML: {0}".format(e))
 
+    def _on_current_converted(self, comic, new_path, xml_content):
+        '''Finish _generate_xml_current once the CBR has been converted'''
+        if not new_path:
+            comic.status = 'error'
+            messagebox.showerror("Error", "Falló la conversión a CBZ")
+            return
+
+        try:
+            comic.set_filepath(new_path)
+            self._inject_xml_now(comic.filepath, xml_content)
+        except Exception as e:
+            comic.status = 'error'
+            messagebox.showerror("Error", "Error generando XML: {0}".format(e))
+            return
+
+        # Update listbox (the selection may have changed while converting)
+        if comic in self.comic_files:
+            index = self.comic_files.index(comic)
+            self.file_listbox.delete(index)
+            self.file_listbox.insert(index, comic.filename)
+            if index == self.current_comic_index:
+                self.file_listbox.selection_set(index)
+
+        comic.status = 'completed'
+        messagebox.showinfo("Éxito", "Conversión a CBZ e inyección de XML completada")
+
+    def _release_archive(self, path):
+        '''Close cached archive handles for path so it can be replaced or removed'''
+        for comic in self.comic_files:
+            if comic.filepath == path:
+                comic.close()
+                # Its embedded ComicInfo.xml is about to change
+                comic.comicinfo_xml_cache = _UNSET
+                comic.comicinfo_gen += 1
+
+    def _convert_cbr_to_cbz_async(self, cbr_path, on_done):
+        '''
+        Convert CBR to CBZ on the I/O pool, showing the progress bar meanwhile.
+        on_done(new_path) runs on the UI thread; new_path is None on failure.
+        '''
+        if cbr_path in self._converting:
+            return
+        self._converting.add(cbr_path)
+        self._release_archive(cbr_path)
+
+        self._update_status("Convirtiendo CBR a CBZ...")
+        self.progress.pack(side=tk.BOTTOM, fill=tk.X, before=self.status_bar)
+        self.progress.configure(mode='indeterminate')
+        self.progress.start()
+
+        def finished(new_path):
+            self._converting.discard(cbr_path)
+            self.progress.stop()
+            self.progress.configure(mode='determinate')
+            self.progress.pack_forget()
+            self._update_status("Conversión a CBZ completada" if new_path
+                                else "Error en la conversión a CBZ")
+            on_done(new_path)
+
+        future = self._io_pool.submit(self._convert_cbr_to_cbz, cbr_path)
+        future.add_done_callback(lambda f: self._post_ui(lambda: finished(f.result())))
+
     def _convert_cbr_to_cbz(self, cbr_path):
-        '''Convert CBR to CBZ (ZIP without compression)'''
-        import shutil
-        
+        '''
+        Convert CBR to CBZ (ZIP without compression).
+        Runs on a worker thread: no Tk calls here other than _log.
+        '''
         cbz_path = os.path.splitext(cbr_path)[0] + '.cbz'
-        temp_dir = tempfile.mkdtemp()
+        temp_dir = None
         
         try:
-            self._update_status("Convirtiendo CBR a CBZ...")
-            self._log("📦 Extrayendo CBR...")
-            
-            # Extract CBR
-            with rarfile.RarFile(cbr_path) as rf:
-                rf.extractall(temp_dir)
-            
             self._log("📦 Creando CBZ sin compresión...")
             # Create CBZ WITHOUT compression (ZIP_STORED)
             # CBZ files are typically uncompressed to allow direct image access
-            with zipfile.ZipFile(cbz_path, 'w', zipfile.ZIP_STORED) as zip_out:
-                for root, dirs, files in os.walk(temp_dir):
-                    # Sort files to maintain page order
-                    files.sort()
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        arcname = os.path.relpath(file_path, temp_dir)
-                        self._log(f"  Añadiendo: {arcname}")
-                        zip_out.write(file_path, arcname)
+            count = 0
+            with _get_rarfile().RarFile(cbr_path) as rf, \
+                    zipfile.ZipFile(cbz_path, 'w', zipfile.ZIP_STORED) as zip_out:
+                if rf.is_solid():
+                    # Entries of a solid archive can only be decompressed from the
+                    # start of the stream, so opening them one by one would be
+                    # quadratic: extract everything in a single pass instead
+                    self._log("📦 Extrayendo CBR...")
+                    temp_dir = tempfile.mkdtemp()
+                    rf.extractall(temp_dir)
+                    for root, dirs, files in os.walk(temp_dir):
+                        # Sort files to maintain page order
+                        files.sort()
+                        for file in files:
+                            file_path = os.path.join(root, file)
+                            arcname = os.path.relpath(file_path, temp_dir)
+                            zip_out.write(file_path, arcname)
+                            count += 1
+                else:
+                    # Stream each entry straight into the CBZ, with no temporary
+                    # copy on disk
+                    for info in sorted(rf.infolist(), key=lambda i: i.filename):
+                        if info.isdir():
+                            continue
+                        date_time = info.date_time
+                        if not date_time or date_time[0] < 1980:
+                            date_time = (1980, 1, 1, 0, 0, 0)
+                        zinfo = zipfile.ZipInfo(info.filename, date_time[:6])
+                        zinfo.file_size = info.file_size  # lets zipfile pick ZIP64 up front
+                        with rf.open(info) as src, zip_out.open(zinfo, 'w') as dst:
+                            shutil.copyfileobj(src, dst, 1024 * 1024)
+                        count += 1
+            # One log line for the whole archive, not one Text insert per page
+            self._log(f"  Añadidos {count} archivos")
             
             # Delete original CBR if successful
             if os.path.exists(cbz_path):
@@ -1599,42 +2346,110 @@ class TebeoSferaGUI(ctk.CTk):
             return None
             
         finally:
-            try:
-                shutil.rmtree(temp_dir)
-            except:
-                pass
+            if temp_dir:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def _inject_xml_now(self, cbz_path, xml_content):
+        '''Inject ComicInfo.xml right away, on the UI thread'''
+        if cbz_path in self._injecting:
+            raise RuntimeError("El archivo se está modificando en segundo plano; inténtalo de nuevo al terminar")
+        self._release_archive(cbz_path)
+        self._inject_xml(cbz_path, xml_content)
 
     def _inject_xml(self, cbz_path, xml_content):
-        '''Inject ComicInfo.xml into CBZ file (without compression)'''
-        import shutil
-        temp_dir = tempfile.mkdtemp()
-        temp_cbz = os.path.join(temp_dir, 'temp.cbz')
+        '''
+        Inject ComicInfo.xml (text or UTF-8 bytes) into CBZ file (without compression).
+        Callers release the archive first (see _inject_xml_now, _inject_xml_async).
+        '''
+        self._log("📝 Inyectando ComicInfo.xml...")
+        if isinstance(xml_content, bytes):
+            xml_bytes = xml_content
+        else:
+            xml_bytes = xml_content.encode('utf-8')
+
+        # Normally only the XML and the central directory are written; the
+        # whole archive is rewritten only when that isn't possible
+        if not self._append_comicinfo(cbz_path, xml_bytes):
+            self._repack_with_comicinfo(cbz_path, xml_bytes)
+        self._log("✅ ComicInfo.xml inyectado correctamente")
+
+    @staticmethod
+    def _append_comicinfo(cbz_path, xml_bytes):
+        '''
+        Add or replace ComicInfo.xml in place, rewriting only the central
+        directory. Returns False if the archive needs a full repack instead.
+
+        Not crash-safe: the XML and the new central directory are written
+        over the old one, so an interruption midway leaves an unreadable
+        archive. _repack_with_comicinfo (and the command-line injector)
+        write a temporary file and swap it in with an atomic os.replace.
+        '''
+        # One handle for the check and the append: the end-of-archive record
+        # and central directory are read from an already open file
+        with open(cbz_path, 'r+b') as f:
+            if not zipfile.is_zipfile(f):
+                # Mode 'a' would append a new archive to whatever the file is
+                return False
+
+            with zipfile.ZipFile(f, 'a') as zf:
+                old = [info for info in zf.filelist if info.filename == 'ComicInfo.xml']
+                if old:
+                    # An existing entry can only be dropped if it is the last one
+                    # stored in the file: truncating there loses nothing else
+                    if len(old) > 1 or any(info.header_offset > old[0].header_offset
+                                           for info in zf.filelist):
+                        return False
+                    zf.filelist.remove(old[0])
+                    del zf.NameToInfo['ComicInfo.xml']
+                    zf.start_dir = old[0].header_offset
+
+                # Add ComicInfo.xml without compression (closing the archive writes
+                # the new central directory and truncates anything after it)
+                zf.writestr('ComicInfo.xml', xml_bytes, compress_type=zipfile.ZIP_STORED)
+        return True
+
+    def _repack_with_comicinfo(self, cbz_path, xml_bytes):
+        '''Rewrite the whole CBZ with a new ComicInfo.xml (without compression)'''
+        # Write the new archive next to the original so the final step is an
+        # atomic rename rather than a copy from /tmp
+        fd, temp_cbz = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(os.path.abspath(cbz_path)))
 
         try:
-            self._log("📝 Inyectando ComicInfo.xml...")
-            with zipfile.ZipFile(cbz_path, 'r') as zip_in:
+            # 1 MiB buffers: local headers and small entries are coalesced
+            # into large sequential reads/writes instead of 8 KiB syscalls
+            with os.fdopen(fd, 'wb', buffering=1024 * 1024) as temp_file, \
+                    open(cbz_path, 'rb', buffering=1024 * 1024) as src_file, \
+                    zipfile.ZipFile(src_file, 'r') as zip_in:
                 # Use ZIP_STORED (no compression) for CBZ
-                with zipfile.ZipFile(temp_cbz, 'w', zipfile.ZIP_STORED) as zip_out:
-                    # Copy all existing files except old ComicInfo.xml
+                with zipfile.ZipFile(temp_file, 'w', zipfile.ZIP_STORED) as zip_out:
+                    # Copy all existing files except old ComicInfo.xml. Entries keep
+                    # their original compression: their stored bytes are copied
+                    # as-is, with no inflate/deflate round trip
                     for item in zip_in.infolist():
-                        if item.filename != 'ComicInfo.xml':
-                            data = zip_in.read(item.filename)
-                            # Preserve original compression info
-                            zip_out.writestr(item, data)
+                        if item.filename == 'ComicInfo.xml':
+                            continue
+                        if not item.flag_bits & 0x1:
+                            _copy_raw_entry(zip_in, zip_out, item)
+                        else:
+                            # Encrypted: the check byte depends on the header
+                            # flags, so stream it through zipfile instead
+                            with zip_in.open(item) as src, zip_out.open(item, 'w') as dst:
+                                shutil.copyfileobj(src, dst, 1024 * 1024)
 
                     # Add ComicInfo.xml without compression
-                    zip_out.writestr('ComicInfo.xml', xml_content.encode('utf-8'), 
+                    zip_out.writestr('ComicInfo.xml', xml_bytes, 
                                    compress_type=zipfile.ZIP_STORED)
 
-            shutil.move(temp_cbz, cbz_path)
-            self._log("✅ ComicInfo.xml inyectado correctamente")
-
-        finally:
-            try:
-                shutil.rmtree(temp_dir)
-            except:
-                # Ignore errors during cleanup; failure to remove temp_dir is not critical
-                pass
+            shutil.copymode(cbz_path, temp_cbz)
+            os.replace(temp_cbz, cbz_path)
+
+        finally:
+            if os.path.exists(temp_cbz):
+                try:
+                    os.remove(temp_cbz)
+                except OSError:
+                    # Ignore errors during cleanup; a stray temp file is not critical
+                    pass
 
     def _process_selected(self):
         '''Process selected comics'''
@@ -1665,17 +2480,18 @@ class TebeoSferaGUI(ctk.CTk):
         self.progress.pack(side=tk.BOTTOM, fill=tk.X, before=self.status_bar)
         self.progress.set(0)  # CTkProgressBar uses 0.0-1.0 range
 
-        # Process comics one by one
-        self._batch_process_next(indices, 0)
+        # Process comics one by one; XML injections run in the background
+        # while the next comic is searched
+        batch = {'pending': 0, 'dispatched': False, 'cancelled': False}
+        self._batch_process_next(indices, 0, batch)
 
-    def _batch_process_next(self, indices, current_index):
+    def _batch_process_next(self, indices, current_index, batch):
         '''Process next comic in batch'''
+        if batch['cancelled']:
+            return
         if current_index >= len(indices):
-            # Batch complete
-            self.progress.pack_forget()
-            messagebox.showinfo("Completado",
-                "Procesamiento por lotes completado.\n\n"
-                "{0} comics procesados.".format(len(indices)))
+            batch['dispatched'] = True
+            self._batch_maybe_finish(indices, batch)
             return
 
         index = indices[current_index]
@@ -1691,60 +2507,148 @@ class TebeoSferaGUI(ctk.CTk):
 
         # If comic already has metadata, generate XML directly
         if comic.metadata and comic.selected_issue:
-            try:
-                xml_content = self.xml_generator.generate_xml(comic.metadata)
-                self._inject_xml(comic.filepath, xml_content)
-                comic.status = 'completed'
+            if not self._batch_inject(comic, indices, batch):
+                return
 
-                # Continue with next
-                self.after(100, lambda: self._batch_process_next(indices, current_index + 1))
-            except Exception as e:
-                comic.status = 'error'
-                if not messagebox.askyesno("Error",
-                    "Error procesando {0}:\n{1}\n\n¿Continuar con los demás?".format(
-                        comic.filename, str(e))):
-                    self.progress.pack_forget()
-                    return
-                self.after(100, lambda: self._batch_process_next(indices, current_index + 1))
+            # Continue with next
+            self.after(5, partial(self._batch_process_next, indices, current_index + 1, batch))
         else:
             # Show search dialog
             def on_dialog_close():
                 # After dialog closes, generate XML if metadata was selected
                 if comic.metadata and comic.selected_issue:
-                    try:
-                        xml_content = self.xml_generator.generate_xml(comic.metadata)
-                        self._inject_xml(comic.filepath, xml_content)
-                        comic.status = 'completed'
-                    except Exception as e:
-                        comic.status = 'error'
-                        if not messagebox.askyesno("Error",
-                            "Error procesando {0}:\n{1}\n\n¿Continuar con los demás?".format(
-                                comic.filename, str(e))):
-                            self.progress.pack_forget()
-                            return
+                    if not self._batch_inject(comic, indices, batch):
+                        return
 
                 # Continue with next comic
-                self.after(100, lambda: self._batch_process_next(indices, current_index + 1))
+                self.after(5, partial(self._batch_process_next, indices, current_index + 1, batch))
+
+            # Create search dialog with cover comparison setting. No
+            # wait_window: the dialog calls on_dialog_close when it goes away
+            BatchSearchDialog(self, comic, self.db, on_dialog_close, 
+                              compare_covers=self.compare_covers_var.get())
+
+            # While the user works on this one, warm up the next comic
+            if current_index + 1 < len(indices):
+                self._prefetch_batch_comic(self.comic_files[indices[current_index + 1]])
+
+    def _prefetch_batch_comic(self, comic):
+        '''Fill the search cache (and the cover, if compared) for a comic the batch shows next'''
+        if comic.metadata and comic.selected_issue:
+            return  # Injected directly, no dialog
+        self._prefetch_covers([comic])
+        title = extract_title_from_filename(comic.filename)
+        if title:
+            self._io_pool.submit(self._prefetch_search, title)
+
+    def _prefetch_search(self, title):
+        '''Worker: run the search the next dialog will start with; the db caches it'''
+        try:
+            self.db.search_series(title)
+        except Exception as e:
+            print("Error precargando búsqueda '{0}': {1}".format(title, e))
+
+    def _batch_inject(self, comic, indices, batch):
+        '''
+        Generate the comic's XML and inject it on the I/O pool.
+        Returns False if the user chose to stop the batch.
+        '''
+        try:
+            xml_content = comic.get_comicinfo_bytes(self.xml_generator)
+        except Exception as e:
+            comic.status = 'error'
+            return self._batch_continue_after_error(comic, e, batch)
+
+        batch['pending'] += 1
+
+        def on_injected(error):
+            batch['pending'] -= 1
+            if error is None:
+                comic.status = 'completed'
+            else:
+                comic.status = 'error'
+                if not batch['cancelled']:
+                    self._batch_continue_after_error(comic, error, batch)
+            self._batch_maybe_finish(indices, batch)
+
+        self._inject_xml_async(comic.filepath, xml_content, on_injected)
+        return True
+
+    def _batch_continue_after_error(self, comic, error, batch):
+        '''Ask whether to go on after a failed comic; cancels the batch if not'''
+        if messagebox.askyesno("Error",
+            "Error procesando {0}:\n{1}\n\n¿Continuar con los demás?".format(
+                comic.filename, str(error))):
+            return True
+        batch['cancelled'] = True
+        self.progress.pack_forget()
+        return False
+
+    def _batch_maybe_finish(self, indices, batch):
+        '''Report the batch once every comic was handled and all injections ended'''
+        if not batch['dispatched'] or batch['pending'] or batch['cancelled']:
+            return
+        # Batch complete
+        self.progress.pack_forget()
+        messagebox.showinfo("Completado",
+            "Procesamiento por lotes completado.\n\n"
+            "{0} comics procesados.".format(len(indices)))
+
+    def _inject_xml_async(self, cbz_path, xml_content, on_done):
+        '''
+        Run _inject_xml on the I/O pool. on_done(error) runs on the UI thread,
+        with error None on success. A path already being written is refused.
+        '''
+        if cbz_path in self._injecting:
+            on_done(RuntimeError("El archivo ya se está modificando"))
+            return
+        self._injecting.add(cbz_path)
+        self._release_archive(cbz_path)
+
+        def finished(error):
+            self._injecting.discard(cbz_path)
+            # The comic may have been shown (and its old XML cached) meanwhile
+            self._release_archive(cbz_path)
+            on_done(error)
 
-            # Create search dialog with cover comparison setting
-            dialog = BatchSearchDialog(self, comic, self.db, on_dialog_close, 
-                                      compare_covers=self.compare_covers_var.get())
-            self.wait_window(dialog)
+        future = self._io_pool.submit(self._inject_xml, cbz_path, xml_content)
+        future.add_done_callback(lambda f: self._post_ui(lambda: finished(f.exception())))
 
     def _update_status(self, message):
         '''Update status bar message'''
         self.status_bar.configure(text=message)
 
+    def _post_ui(self, callback):
+        '''Queue a callback to run on the UI thread (safe from worker threads)'''
+        self.update_queue.put(callback)
+        with self._queue_lock:
+            if self._queue_scheduled:
+                return
+            self._queue_scheduled = True
+        self.after(0, self._process_queue)
+
     def _process_queue(self):
         '''Process updates from background threads'''
-        try:
-            while True:
+        # Run a bounded number of callbacks so a burst of results cannot stall
+        # the mainloop; come back shortly if there is still work queued.
+        # Nothing is scheduled while the queue is idle: _post_ui wakes us up.
+        processed = 0
+        while processed < MAX_QUEUE_MSGS_PER_TICK:
+            try:
                 callback = self.update_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
                 callback()
-        except queue.Empty:
-            pass
+            except Exception:
+                traceback.print_exc()
+            processed += 1
 
-        self.after(100, self._process_queue)
+        with self._queue_lock:
+            if self.update_queue.empty():
+                self._queue_scheduled = False
+                return
+        self.after(10, self._process_queue)
 
     def _show_about(self):
         '''Show about dialog'''
@@ -1758,6 +2662,12 @@ class TebeoSferaGUI(ctk.CTk):
     def _on_close(self):
         '''Handle window close'''
         if messagebox.askokcancel("Salir", "¿Cerrar la aplicación?"):
+            self._cancel_cover_prefetch()
+            _shutdown_executor(self._cover_pool)
+            _shutdown_executor(self._io_pool)
+            SearchDialog.shutdown_pools()
+            for comic in self.comic_files:
+                comic.close()
             self.db.close()
             self.destroy()
 
@@ -1767,25 +2677,7 @@ class TebeoSferaGUI(ctk.CTk):
             messagebox.showwarning("Advertencia", "Selecciona un comic primero")
             return
 
-        comic = self.comic_files[self.current_comic_index]
-        url = None
-
-        if comic.metadata:
-            url = comic.metadata.get('webpage') or comic.metadata.get('webpage_s')
-            if not url:
-                collection_url = comic.metadata.get('collection_url')
-                if collection_url:
-                    url = build_series_url(collection_url)
-
-        if not url and getattr(comic, 'selected_issue', None):
-            url = build_issue_url(getattr(comic.selected_issue, 'issue_key', None))
-
-        if not url and getattr(comic, 'selected_issue', None):
-            # Fallback to series if available in issue metadata
-            series_key = getattr(comic.selected_issue, 'series_key', None)
-            if series_key:
-                url = build_series_url(series_key)
-
+        url = self.comic_files[self.current_comic_index].get_browser_url()
         if url:
             self._log(f"🌐 Abriendo en navegador: {url}")
             webbrowser.open(url)
@@ -1794,37 +2686,66 @@ class TebeoSferaGUI(ctk.CTk):
 
     def _log(self, message):
         '''Add a message to the log (thread-safe)'''
-        timestamp = strftime('%H:%M:%S')
-        log_entry = f"[{timestamp}] {message}\n"
-        
-        # Use after() to ensure we're in the main thread
-        def update_log():
-            try:
-                self.log_text.config(state=tk.NORMAL)
-                self.log_text.insert(tk.END, log_entry)
-                self.log_text.see(tk.END)
-                self.log_text.config(state=tk.DISABLED)
-            except:
-                pass  # Widget might not exist yet
-        
-        # Always print to console (works from any thread)
-        print(log_entry.strip())
-        
+        # The "[HH:MM:SS] " prefix is only formatted once per second
+        now = int(time())
+        second, prefix = self._log_prefix
+        if second != now:
+            prefix = strftime('[%H:%M:%S] ')
+            self._log_prefix = (now, prefix)
+        log_entry = prefix + message + '\n'
+        
+        # Always print to console (works from any thread; no console under pythonw)
+        if sys.stdout is not None:
+            sys.stdout.write(log_entry)
+        
+        # Buffer the line; bursts of messages reach the widget in a single
+        # flush instead of one after() callback and insert per line
+        with self._log_lock:
+            self._log_buf.append(log_entry)
+            self._log_history.append(log_entry)
+            if self._log_flush_scheduled:
+                return
+            self._log_flush_scheduled = True
+
         # Update GUI in main thread
         try:
-            self.after(0, update_log)
-        except:
-            # If after() fails, try direct update (we might be in main thread)
-            try:
-                update_log()
-            except:
-                pass
+            self.after(100, self._flush_log)
+        except Exception:
+            # No event loop to schedule on (yet): the next message retries
+            with self._log_lock:
+                self._log_flush_scheduled = False
+
+    def _flush_log(self):
+        '''Write all buffered log lines to the log panel in one insert'''
+        with self._log_lock:
+            pending = ''.join(self._log_buf)
+            self._log_buf.clear()
+            self._log_flush_scheduled = False
+        if not pending:
+            return
+
+        try:
+            # Only follow new output if the user hasn't scrolled up
+            at_bottom = self.log_text.yview()[1] > 0.95
+            self.log_text.config(state=tk.NORMAL)
+            self.log_text.insert(tk.END, pending)
+            # Keep a rolling window: Text gets slower as it grows
+            line_count = int(self.log_text.index('end-1c').split('.')[0])
+            if line_count > MAX_LOG_LINES:
+                self.log_text.delete('1.0', f'{line_count - MAX_LOG_LINES}.0')
+            if at_bottom:
+                self.log_text.see(tk.END)
+            self.log_text.config(state=tk.DISABLED)
+        except (AttributeError, tk.TclError):
+            pass  # Widget might not exist yet (or anymore)
 
     def _clear_log(self):
         '''Clear the log'''
         self.log_text.config(state=tk.NORMAL)
         self.log_text.delete('1.0', tk.END)
         self.log_text.config(state=tk.DISABLED)
+        with self._log_lock:
+            self._log_history.clear()
         self._log("Log limpiado")
 
     def _save_log(self):
@@ -1836,8 +2757,12 @@ class TebeoSferaGUI(ctk.CTk):
         )
         if filename:
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(self.log_text.get('1.0', tk.END))
+                # Saved from the history, which goes further back than the
+                # panel and already holds lines not flushed to it yet
+                with self._log_lock:
+                    history = list(self._log_history)
+                with open(filename, 'w', encoding='utf-8', buffering=1024 * 1024) as f:
+                    f.writelines(history)
                 self._log(f"✅ Log guardado en: {filename}")
                 messagebox.showinfo("Éxito", f"Log guardado en:\n{filename}")
             except Exception as e:
@@ -1848,6 +2773,34 @@ class TebeoSferaGUI(ctk.CTk):
 class SearchDialog(ctk.CTkToplevel):
     '''Dialog for searching and selecting issues from TebeoSfera'''
 
+    # Cover download pool, shared by every dialog (created on first use)
+    _download_pool = None
+    _download_pool_lock = threading.Lock()
+
+    # Preview cover pool, also shared (see _load_preview)
+    _preview_pool = None
+    # Searches, metadata queries and other one-off background work, also shared
+    _task_pool = None
+
+    # (ComicInfoGenerator key, display key) pairs for _issue_to_metadata_dict, in XML dict order
+    _XML_DICT_KEYS = (
+        ('title', 'Title'), ('series', 'Series'), ('number', 'Number'), ('count', 'Count'),
+        ('volume', 'Volume'), ('summary', 'Summary'), ('publisher', 'Publisher'),
+        ('year', 'Year'), ('month', 'Month'), ('day', 'Day'),
+        ('writer', 'Writer'), ('penciller', 'Penciller'), ('inker', 'Inker'),
+        ('colorist', 'Colorist'), ('letterer', 'Letterer'), ('cover_artist', 'CoverArtist'),
+        ('editor', 'Editor'), ('translator', 'Translator'), ('genre', 'Genre'),
+        ('characters', 'Characters'), ('page_count', 'PageCount'), ('language_iso', 'LanguageISO'),
+        ('format', 'Format'), ('binding', 'Binding'), ('dimensions', 'Dimensions'),
+        ('isbn', 'ISBN'), ('legal_deposit', 'LegalDeposit'), ('price', 'Price'),
+        ('original_title', 'OriginalTitle'), ('original_publisher', 'OriginalPublisher'),
+        ('web', 'Web'),
+    )
+
+    # Recently fetched cover bytes by URL, shared by every dialog (LRU order)
+    _image_data_cache = OrderedDict()
+    _image_data_lock = threading.Lock()
+
     def __init__(self, parent, comic, db, compare_covers=False):
         ctk.CTkToplevel.__init__(self, parent)
 
@@ -1865,6 +2818,8 @@ class SearchDialog(ctk.CTkToplevel):
         self.transient(parent)
 
         self.parent = parent  # Store parent reference for logging
+        # Resolved once: search and compare threads log a line per step
+        self._parent_log = getattr(parent, '_log', None)
         self.comic = comic
         self.db = db
         self.compare_covers = compare_covers  # Whether to compare covers (slow)
@@ -1883,6 +2838,24 @@ class SearchDialog(ctk.CTkToplevel):
             'cache_hits': 0,
             'cache_misses': 0
         }
+        # Worker threads report stats and status often (once per cover):
+        # counts are kept under a lock and the labels redrawn once per burst
+        self._ui_lock = threading.Lock()
+        self._stats_refresh_scheduled = False
+        self._pending_status = None
+        self._status_scheduled = False
+        self._preview_future = None
+
+        # Bumped on every new preview / search: background work started for
+        # an older generation is dropped instead of being displayed
+        self._preview_gen = 0
+        self._compare_gen = 0
+        # Downloads of the running comparison, cancelled when it is dropped
+        self._compare_futures = ()
+        # Pending debounced preview load, and LRU of scaled previews:
+        # (cover url, canvas size) -> PhotoImage
+        self._preview_after_id = None
+        self._preview_photos = OrderedDict()
 
         # Image comparison data
         self.downloaded_images = []  # Store PIL images for comparison
@@ -1904,6 +2877,21 @@ class SearchDialog(ctk.CTkToplevel):
         # Auto-search based on filename (delay to ensure UI is ready)
         self.after(100, self._auto_search)
 
+    def destroy(self):
+        '''Drop the dialog's background work before the widgets go away'''
+        # Workers still running see a stale generation and post nothing
+        self._compare_gen += 1
+        self._preview_gen += 1
+        if self._preview_after_id is not None:
+            self.after_cancel(self._preview_after_id)
+            self._preview_after_id = None
+        if self._preview_future is not None:
+            self._preview_future.cancel()
+        for future in self._compare_futures:
+            future.cancel()
+        self._compare_futures = ()
+        super().destroy()
+
     def _create_ui(self):
         '''Create search dialog UI with improved styling'''
         # Search frame with card styling
@@ -1975,7 +2963,9 @@ class SearchDialog(ctk.CTkToplevel):
                  background=[('selected', self.colors['primary'])],
                  foreground=[('selected', 'white')])
         
-        self.results_tree = ttk.Treeview(tree_frame, yscrollcommand=scrollbar.set, 
+        self._results_scrollbar = scrollbar
+        self._more_rows_scheduled = False
+        self.results_tree = ttk.Treeview(tree_frame, yscrollcommand=self._on_results_yscroll, 
                                         show='tree', style="Search.Treeview")
         self.results_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.results_tree.bind('<<TreeviewSelect>>', self._on_tree_select)
@@ -2002,6 +2992,12 @@ class SearchDialog(ctk.CTkToplevel):
         # Store tree item data: {item_id: (type, object)}
         # type can be: 'issue', 'collection', 'saga', 'issue_item'
         self.tree_item_data = {}
+        # Result headers whose rows haven't been inserted yet: {item_id: rows}
+        self._pending_groups = {}
+        # Saga/collection rows whose children haven't been loaded yet (they
+        # only hold a "Cargando..." placeholder, which ttk needs to draw the
+        # expand arrow)
+        self._needs_lazy_load = set()
 
         # Right: Preview panel (card style)
         right_container = tk.Frame(main_paned, bg=self.colors['bg'])
@@ -2109,7 +3105,8 @@ class SearchDialog(ctk.CTkToplevel):
                                         highlightthickness=1,
                                         highlightbackground=self.colors['border'],
                                         highlightcolor=self.colors['primary'],
-                                        padx=8, pady=8)
+                                        padx=8, pady=8,
+                                        undo=False, autoseparators=False, maxundo=0)
         self.metadata_display.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         metadata_scrollbar.config(command=self.metadata_display.yview)
         
@@ -2167,28 +3164,66 @@ class SearchDialog(ctk.CTkToplevel):
 
     def _log(self, message):
         '''Add a message to the log (delegates to parent if available)'''
-        if hasattr(self, 'parent') and hasattr(self.parent, '_log'):
-            self.parent._log(message)
+        if self._parent_log is not None:
+            self._parent_log(message)
         else:
             print(f"[LOG] {message}")
 
     def _safe_update_status(self, message):
-        '''Safely update status label, checking if widget still exists'''
-        def update():
-            try:
-                if hasattr(self, 'status_label') and self.status_label.winfo_exists():
-                    self.status_label.configure(text=message)
-            except (tk.TclError, AttributeError):
-                # Widget was destroyed, ignore
-                pass
-        
-        self.after(0, update)
+        '''
+        Set the status label from any thread. Only the latest message of a
+        burst is drawn, with a single main-loop callback.
+        '''
+        with self._ui_lock:
+            self._pending_status = message
+            if self._status_scheduled:
+                return
+            self._status_scheduled = True
+
+        self.after(0, self._apply_pending_status)
+
+    def _apply_pending_status(self):
+        '''Show the message left by _safe_update_status, if the widget still exists'''
+        with self._ui_lock:
+            message = self._pending_status
+            self._status_scheduled = False
+        try:
+            if hasattr(self, 'status_label') and self.status_label.winfo_exists():
+                self.status_label.configure(text=message)
+        except (tk.TclError, AttributeError):
+            # Widget was destroyed, ignore
+            pass
 
     def _fetch_reference_image_data(self, ref):
-        '''Fetch high-resolution image data for a SeriesRef or IssueRef'''
+        '''
+        Fetch high-resolution image data for a SeriesRef or IssueRef.
+        The last IMAGE_DATA_CACHE_SIZE images are kept in memory, so previews
+        after a cover comparison (or in the next batch dialog) don't hit the
+        network or the disk cache again.
+        '''
         if not ref:
             return None
 
+        key = (getattr(ref, 'extra_image_url', None) or getattr(ref, 'thumb_url_s', None))
+        if key:
+            with self._image_data_lock:
+                data = self._image_data_cache.get(key)
+                if data is not None:
+                    self._image_data_cache.move_to_end(key)
+            if data is not None:
+                self._update_http_stats(from_cache=True)
+                return data
+
+        data = self._download_reference_image_data(ref)
+        if data and key:
+            with self._image_data_lock:
+                self._image_data_cache[key] = data
+                if len(self._image_data_cache) > IMAGE_DATA_CACHE_SIZE:
+                    self._image_data_cache.popitem(last=False)
+        return data
+
+    def _download_reference_image_data(self, ref):
+        '''Image data for a reference, from the db image cache or the network'''
         extra_url = getattr(ref, 'extra_image_url', None)
         if extra_url:
             try:
@@ -2248,6 +3283,34 @@ class SearchDialog(ctk.CTkToplevel):
             self._log(f"⚠️ Error obteniendo imagen desde DB: {e}")
             return None
 
+    @classmethod
+    def _get_download_pool(cls):
+        '''Bounded thread pool for cover downloads'''
+        with cls._download_pool_lock:
+            if cls._download_pool is None:
+                cls._download_pool = ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS)
+            return cls._download_pool
+
+    @classmethod
+    def shutdown_pools(cls):
+        '''Cancel queued work and stop the shared pools (on application exit)'''
+        with cls._download_pool_lock:
+            pools = (cls._download_pool, cls._preview_pool, cls._task_pool)
+            cls._download_pool = cls._preview_pool = cls._task_pool = None
+        for pool in pools:
+            _shutdown_executor(pool)
+
+    def _fetch_compare_image(self, ref):
+        '''Download a reference cover and shrink it for comparison (runs in the pool)'''
+        image_data = self._fetch_reference_image_data(ref)
+        if not image_data:
+            return None
+        # Only used for comparison: shrink once at download time, and hash it
+        # here too so find_best_match is left with XOR/popcount only
+        image = ImageComparator.prepare_image(Image.open(BytesIO(image_data)))
+        ImageComparator.calculate_features(image)
+        return image
+
     def _update_open_buttons(self):
         '''Enable/disable open buttons based on current selections'''
         if hasattr(self, 'open_series_button'):
@@ -2365,40 +3428,46 @@ class SearchDialog(ctk.CTkToplevel):
     
     def _update_http_stats(self, request_info=None, from_cache=False):
         '''Update HTTP statistics and display (thread-safe)'''
-        def update():
-            try:
-                if from_cache:
-                    self.http_stats['cache_hits'] += 1
-                else:
-                    self.http_stats['cache_misses'] += 1
-                    if request_info:
-                        self.http_stats['total_requests'] += 1
-                        # Get bytes value - only fallback when key is missing, not when value is 0
-                        bytes_value = request_info.get('size_bytes')
-                        if bytes_value is None:
-                            bytes_value = request_info.get('bytes', 0)
-                        self.http_stats['total_bytes'] += bytes_value
-                        self.http_stats['total_time_ms'] += request_info.get('elapsed_ms', 0) or 0
-                
-                # Update display
-                requests = self.http_stats['total_requests']
-                kb = self.http_stats['total_bytes'] / 1024.0
-                ms = self.http_stats['total_time_ms']
-                hits = self.http_stats['cache_hits']
-                misses = self.http_stats['cache_misses']
-                
-                stats_text = f"📡 HTTP: {requests} solicitudes | {kb:.1f} KB | {ms:.0f} ms"
-                if hits > 0 or misses > 0:
-                    stats_text += f" | 🗄️ Cache: {hits} hits / {misses} misses"
-                
-                if hasattr(self, 'http_stats_label') and self.http_stats_label.winfo_exists():
-                    self.http_stats_label.configure(text=stats_text)
-            except (tk.TclError, AttributeError):
-                # Widget destroyed, ignore
-                pass
-        
-        # Execute in main thread
-        self.after(0, update)
+        with self._ui_lock:
+            if from_cache:
+                self.http_stats['cache_hits'] += 1
+            else:
+                self.http_stats['cache_misses'] += 1
+                if request_info:
+                    self.http_stats['total_requests'] += 1
+                    # Get bytes value - only fallback when key is missing, not when value is 0
+                    bytes_value = request_info.get('size_bytes')
+                    if bytes_value is None:
+                        bytes_value = request_info.get('bytes', 0)
+                    self.http_stats['total_bytes'] += bytes_value
+                    self.http_stats['total_time_ms'] += request_info.get('elapsed_ms', 0) or 0
+            if self._stats_refresh_scheduled:
+                return
+            self._stats_refresh_scheduled = True
+
+        # Update display in main thread
+        self.after(0, self._refresh_http_stats)
+
+    def _refresh_http_stats(self):
+        '''Redraw the HTTP statistics label with the current counts'''
+        with self._ui_lock:
+            self._stats_refresh_scheduled = False
+            requests = self.http_stats['total_requests']
+            kb = self.http_stats['total_bytes'] / 1024.0
+            ms = self.http_stats['total_time_ms']
+            hits = self.http_stats['cache_hits']
+            misses = self.http_stats['cache_misses']
+
+        stats_text = f"📡 HTTP: {requests} solicitudes | {kb:.1f} KB | {ms:.0f} ms"
+        if hits > 0 or misses > 0:
+            stats_text += f" | 🗄️ Cache: {hits} hits / {misses} misses"
+
+        try:
+            if hasattr(self, 'http_stats_label') and self.http_stats_label.winfo_exists():
+                self.http_stats_label.configure(text=stats_text)
+        except (tk.TclError, AttributeError):
+            # Widget destroyed, ignore
+            pass
 
     def _auto_search(self):
         '''Auto-search based on filename with edit option'''
@@ -2464,14 +3533,25 @@ class SearchDialog(ctk.CTkToplevel):
         self.results_label.config(text="Resultados:")
 
         # Clear tree
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
+        # One delete call for the whole tree rather than one per top-level row
+        self.results_tree.delete(*self.results_tree.get_children())
         self.tree_item_data = {}
+        self._pending_groups = {}
+        self._needs_lazy_load = set()
+        # Any cover comparison still running belongs to the previous search
+        self._compare_gen += 1
+        search_gen = self._compare_gen
         
         # Add loading placeholder
         loading_item = self.results_tree.insert('', 'end', text="Buscando...", tags=('loading',))
+
+        # Query refined from a recent search: show its matching results while
+        # the real search runs (compare mode waits for the scored rows)
+        if not self.compare_covers and hasattr(self.db, 'narrow_recent_search'):
+            provisional = self.db.narrow_recent_search(query)
+            if provisional:
+                self._insert_result_groups(self._group_results_by_type(provisional))
         self.status_label.configure(text="Conectando con TebeoSfera...")
-        self.update()
         
         # Log the search
         self._log(f"🔍 Iniciando búsqueda: '{query}'")
@@ -2541,9 +3621,10 @@ class SearchDialog(ctk.CTkToplevel):
 
                 def update_results(request_info=request_info):
                     # Clear tree
-                    for item in self.results_tree.get_children():
-                        self.results_tree.delete(item)
+                    self.results_tree.delete(*self.results_tree.get_children())
                     self.tree_item_data = {}
+                    self._pending_groups = {}
+                    self._needs_lazy_load = set()
                     
                     self.search_results = results
 
@@ -2562,9 +3643,10 @@ class SearchDialog(ctk.CTkToplevel):
 
                     # Group results by type and display in tree
                     # Separate into sagas, collections, and issues
-                    sagas = [r for r in results if getattr(r, 'type_s', 'collection') == 'saga']
-                    collections = [r for r in results if getattr(r, 'type_s', 'collection') == 'collection']
-                    issues = [r for r in results if getattr(r, 'type_s', 'collection') == 'issue']
+                    groups = self._group_results_by_type(results)
+                    sagas = [r for _, r in groups['saga']]
+                    collections = [r for _, r in groups['collection']]
+                    issues = [r for _, r in groups['issue']]
                     
                     # Debug: log types found
                     self._log(f"📊 Tipos detectados: {len(sagas)} sagas, {len(collections)} colecciones, {len(issues)} issues")
@@ -2575,47 +3657,11 @@ class SearchDialog(ctk.CTkToplevel):
                     # Only insert results if NOT doing image comparison
                     # (image comparison will insert them with scores)
                     if not self.compare_covers:
-                        # Insert sagas first
-                        if sagas:
-                            sagas_parent = self.results_tree.insert('', 'end', text=f"🗂️ Sagas ({len(sagas)})", tags=('header',))
-                            self.tree_item_data[sagas_parent] = ('header', None)
-                            for result in sagas:
-                                display_name = result.series_name_s
-                                item_id = self.results_tree.insert(sagas_parent, 'end', text=display_name, tags=('saga',))
-                                # Add placeholder child to enable expansion
-                                placeholder_id = self.results_tree.insert(item_id, 'end', text="Cargando...", tags=('loading',))
-                                self.tree_item_data[item_id] = ('saga', result)
-                                self.tree_item_data[placeholder_id] = ('loading', None)  # Store placeholder
-                        
-                        # Insert collections
-                        if collections:
-                            collections_parent = self.results_tree.insert('', 'end', text=f"📚 Colecciones ({len(collections)})", tags=('header',))
-                            self.tree_item_data[collections_parent] = ('header', None)
-                            for result in collections:
-                                display_name = result.series_name_s
-                                item_id = self.results_tree.insert(collections_parent, 'end', text=display_name, tags=('collection',))
-                                # Add placeholder child to enable expansion
-                                placeholder_id = self.results_tree.insert(item_id, 'end', text="Cargando...", tags=('loading',))
-                                self.tree_item_data[item_id] = ('collection', result)
-                                self.tree_item_data[placeholder_id] = ('loading', None)  # Store placeholder
-                        
-                        # Insert issues
-                        if issues:
-                            issues_parent = self.results_tree.insert('', 'end', text=f"📖 Issues ({len(issues)})", tags=('header',))
-                            self.tree_item_data[issues_parent] = ('header', None)
-                            for result in issues:
-                                display_name = result.series_name_s
-                                item_id = self.results_tree.insert(issues_parent, 'end', text=display_name, tags=('issue',))
-                                self.tree_item_data[item_id] = ('issue', result)
-
-                    # Count by type
-                    type_counts = {'issue': 0, 'collection': 0, 'saga': 0}
-                    for result in results:
-                        type_attr = getattr(result, 'type_s', 'collection')
-                        if type_attr in type_counts:
-                            type_counts[type_attr] += 1
-                        else:
-                            type_counts['collection'] += 1
+                        self._insert_result_groups(groups)
+
+                    # Count by type (unknown types count as collections)
+                    type_counts = {'issue': len(issues), 'saga': len(sagas),
+                                   'collection': len(collections) + len(groups[None])}
                     
                     status_text = f"{len(results)} resultados: {type_counts['issue']} issues, {type_counts['collection']} series, {type_counts['saga']} sagas"
                     if info_line:
@@ -2645,124 +3691,113 @@ class SearchDialog(ctk.CTkToplevel):
                 self._safe_update_status(error_msg)
                 self._log(f"❌ {error_msg}")
                 def show_error():
+                    # Drop the provisional rows (unless a newer search owns the tree):
+                    # they are not results for the query that failed
+                    if search_gen == self._compare_gen:
+                        self.results_tree.delete(*self.results_tree.get_children())
+                        self.tree_item_data = {}
+                        self._pending_groups = {}
+                        self._needs_lazy_load = set()
+                        self.selected_series = None
+                        self.selected_issue = None
+                        self._update_open_buttons()
+                        self.results_tree.insert('', 'end', text="Error en la búsqueda", tags=('empty',))
                     try:
                         messagebox.showerror("Error", error_msg)
                     except:
                         pass
                 self.after(0, show_error)
 
-        thread = threading.Thread(target=search_thread)
-        thread.daemon = True
-        thread.start()
+        self._run_in_background(search_thread)
 
     def _compare_covers_with_results(self, results):
         '''Compare comic cover with search results covers'''
+        self._compare_gen += 1
+        gen = self._compare_gen
+
         def compare_thread():
-            self.downloaded_images = []
+            self.downloaded_images = [None] * len(results)
             self.similarity_scores = []
             
             def update_status(msg):
-                def safe_update():
-                    try:
-                        # Check if widget still exists
-                        if hasattr(self, 'status_label') and self.status_label.winfo_exists():
-                            self.status_label.configure(text=msg)
-                    except (tk.TclError, AttributeError):
-                        # Widget was destroyed, ignore
-                        pass
-                    # Always log (this is safe)
-                    try:
-                        self._log(msg)
-                    except:
-                        pass
-                
-                self.after(0, safe_update)
+                # Both are thread-safe and coalesce bursts of messages
+                self._safe_update_status(msg)
+                self._log(msg)
 
             update_status(f"Descargando {len(results)} portadas para comparar...")
             
-            # Download all covers
-            for i, result in enumerate(results):
+            # Download all covers in parallel (the connection still spaces
+            # out the requests themselves); results are stored by index
+            pool = self._get_download_pool()
+            futures = {pool.submit(self._fetch_compare_image, result): i
+                       for i, result in enumerate(results)}
+            self._compare_futures = list(futures)
+            next_status = 0
+            for done, future in enumerate(as_completed(futures), 1):
+                if gen != self._compare_gen:
+                    # Superseded by a newer search: drop the queued downloads
+                    for pending in futures:
+                        pending.cancel()
+                    return
+                i = futures[future]
                 try:
-                    update_status(f"Descargando portada {i+1}/{len(results)}: {result.series_name_s}")
-                    image_data = self._fetch_reference_image_data(result)
-                    if image_data:
-                        image = Image.open(BytesIO(image_data))
-                        self.downloaded_images.append(image)
-                    else:
-                        self.downloaded_images.append(None)
+                    self.downloaded_images[i] = future.result()
                 except Exception as e:
-                    self.downloaded_images.append(None)
-                    self.after(0, lambda: self._log(f"⚠️ Error descargando portada {i+1}: {str(e)}"))
+                    self._log(f"⚠️ Error descargando portada {i+1}: {str(e)}")
+                # Cached covers complete in bursts: report progress (which is
+                # also logged) at most every COMPARE_STATUS_INTERVAL seconds
+                if time() >= next_status or done == len(results):
+                    next_status = time() + COMPARE_STATUS_INTERVAL
+                    update_status(f"Descargada portada {done}/{len(results)}: {results[i].series_name_s}")
 
             update_status("Comparando portadas con el comic...")
 
             # Compare with comic cover
-            if self.comic.cover_image and self.downloaded_images:
+            if gen == self._compare_gen and self.comic.cover_image and self.downloaded_images:
                 self.best_match_index, self.similarity_scores = ImageComparator.find_best_match(
                     self.comic.cover_image,
-                    self.downloaded_images
+                    self.downloaded_images,
+                    self.comic.cover_hash
                 )
 
                 def update_ui():
+                    if gen != self._compare_gen:
+                        return
                     # Update tree with scores, grouped by type
                     # Clear and rebuild tree with scores
-                    for item in self.results_tree.get_children():
-                        self.results_tree.delete(item)
+                    self.results_tree.delete(*self.results_tree.get_children())
                     self.tree_item_data = {}
+                    self._pending_groups = {}
+                    self._needs_lazy_load = set()
                     
+                    # Row text for every result, formatted once by position
+                    scores = self.similarity_scores
+                    best_index = self.best_match_index
+                    best_score = scores[best_index] if best_index is not None and 0 <= best_index < len(scores) else 0
+                    if best_score <= 60:
+                        best_index = None
+                    display = [f"{BEST_MATCH_PREFIX if i == best_index else ''}{result.series_name_s} "
+                               f"({scores[i] if i < len(scores) else 0:.0f}%)"
+                               for i, result in enumerate(results)]
+
                     # Group results by type
-                    sagas = [(i, r) for i, r in enumerate(results) if getattr(r, 'type_s', 'collection') == 'saga']
-                    collections = [(i, r) for i, r in enumerate(results) if getattr(r, 'type_s', 'collection') == 'collection']
-                    issues = [(i, r) for i, r in enumerate(results) if getattr(r, 'type_s', 'collection') == 'issue']
+                    groups = self._group_results_by_type(results)
                     
                     best_item_id = None
-                    best_score = 0
                     
-                    # Insert sagas first
-                    if sagas:
-                        sagas_parent = self.results_tree.insert('', 'end', text=f"🗂️ Sagas ({len(sagas)})", tags=('header',))
-                        self.tree_item_data[sagas_parent] = ('header', None)
-                        for i, result in sagas:
-                            score = self.similarity_scores[i] if i < len(self.similarity_scores) else 0
-                            prefix = "⭐ " if i == self.best_match_index and score > 60 else ""
-                            display_text = f"{prefix}{result.series_name_s} ({score:.0f}%)"
-                            item_id = self.results_tree.insert(sagas_parent, 'end', text=display_text, tags=('saga',))
-                            placeholder_id = self.results_tree.insert(item_id, 'end', text="Cargando...", tags=('loading',))
-                            self.tree_item_data[item_id] = ('saga', result)
-                            self.tree_item_data[placeholder_id] = ('loading', None)  # Store placeholder
-                            if i == self.best_match_index and score > 60:
-                                best_item_id = item_id
-                                best_score = score
-                    
-                    # Insert collections
-                    if collections:
-                        collections_parent = self.results_tree.insert('', 'end', text=f"📚 Colecciones ({len(collections)})", tags=('header',))
-                        self.tree_item_data[collections_parent] = ('header', None)
-                        for i, result in collections:
-                            score = self.similarity_scores[i] if i < len(self.similarity_scores) else 0
-                            prefix = "⭐ " if i == self.best_match_index and score > 60 else ""
-                            display_text = f"{prefix}{result.series_name_s} ({score:.0f}%)"
-                            item_id = self.results_tree.insert(collections_parent, 'end', text=display_text, tags=('collection',))
-                            placeholder_id = self.results_tree.insert(item_id, 'end', text="Cargando...", tags=('loading',))
-                            self.tree_item_data[item_id] = ('collection', result)
-                            self.tree_item_data[placeholder_id] = ('loading', None)  # Store placeholder
-                            if i == self.best_match_index and score > 60:
-                                best_item_id = item_id
-                                best_score = score
-                    
-                    # Insert issues
-                    if issues:
-                        issues_parent = self.results_tree.insert('', 'end', text=f"📖 Issues ({len(issues)})", tags=('header',))
-                        self.tree_item_data[issues_parent] = ('header', None)
-                        for i, result in issues:
-                            score = self.similarity_scores[i] if i < len(self.similarity_scores) else 0
-                            prefix = "⭐ " if i == self.best_match_index and score > 60 else ""
-                            display_text = f"{prefix}{result.series_name_s} ({score:.0f}%)"
-                            item_id = self.results_tree.insert(issues_parent, 'end', text=display_text, tags=('issue',))
-                            self.tree_item_data[item_id] = ('issue', result)
-                            if i == self.best_match_index and score > 60:
-                                best_item_id = item_id
-                                best_score = score
+                    # Insert sagas first, then collections and issues (rows are
+                    # inserted lazily, except in the group holding the best match)
+                    for item_type, header in RESULT_GROUP_HEADERS:
+                        group = groups[item_type]
+                        if not group:
+                            continue
+                        rows = [(display[i], item_type, result) for i, result in group]
+                        best_row = next((n for n, (i, _) in enumerate(group) if i == best_index), None)
+                        group_id = self._insert_result_group(header.format(len(group)), rows)
+                        if best_row is not None:
+                            # Insert at least as far as the best match, so it can be shown
+                            count = max(RESULT_ROWS_PER_BATCH, best_row + 1)
+                            best_item_id = self._populate_result_group(group_id, count)[best_row]
 
                     # Auto-select best match if score is good enough
                     if best_item_id:
@@ -2785,9 +3820,7 @@ class SearchDialog(ctk.CTkToplevel):
 
                 self.after(0, update_ui)
 
-        thread = threading.Thread(target=compare_thread)
-        thread.daemon = True
-        thread.start()
+        self._run_in_background(compare_thread)
 
     def _on_tree_select(self, event):
         '''Handle tree item selection'''
@@ -2844,34 +3877,122 @@ class SearchDialog(ctk.CTkToplevel):
             self._show_issue_preview_with_metadata(item_obj)
         # Collections and sagas expand on double-click (handled by tree expansion)
     
+    @staticmethod
+    def _group_results_by_type(results):
+        '''
+        Split search results by type_s in a single pass: a dict with
+        'saga', 'collection' and 'issue' lists of (index, result) pairs,
+        plus any other type under None
+        '''
+        groups = {'saga': [], 'collection': [], 'issue': [], None: []}
+        for i, result in enumerate(results):
+            groups.get(getattr(result, 'type_s', 'collection'), groups[None]).append((i, result))
+        return groups
+
+    def _insert_result_groups(self, groups):
+        '''
+        Insert a header per non-empty group from _group_results_by_type,
+        sagas first, then collections and issues, with plain names as rows
+        '''
+        for item_type, header in RESULT_GROUP_HEADERS:
+            group = groups[item_type]
+            if group:
+                self._insert_result_group(
+                    header.format(len(group)),
+                    [(result.series_name_s, item_type, result) for _, result in group])
+
+    def _insert_result_group(self, label, rows):
+        '''
+        Insert a collapsed header for a group of search results.
+        Its rows, (display_text, item_type, result) tuples, are only inserted
+        when the header is first expanded, RESULT_ROWS_PER_BATCH at a time
+        (see _populate_result_group).
+        '''
+        parent = self.results_tree.insert('', 'end', text=label, tags=('header',))
+        self.tree_item_data[parent] = ('header', None)
+        # Placeholder child so the header shows the expand arrow
+        placeholder_id = self.results_tree.insert(parent, 'end', text="Cargando...", tags=('loading',))
+        self.tree_item_data[placeholder_id] = ('loading', None)
+        # [rows, number of rows inserted so far]
+        self._pending_groups[parent] = [rows, 0]
+        return parent
+
+    def _populate_result_group(self, parent, count=RESULT_ROWS_PER_BATCH):
+        '''
+        Insert the next count rows of a header created by _insert_result_group.
+        Returns the ids of the inserted rows.
+        '''
+        pending = self._pending_groups.get(parent)
+        if pending is None:
+            return []
+        rows, start = pending
+        if start == 0:
+            placeholders = self.results_tree.get_children(parent)
+            self.results_tree.delete(*placeholders)
+            for child in placeholders:
+                self.tree_item_data.pop(child, None)
+        pending[1] = start + count
+        if pending[1] >= len(rows):
+            del self._pending_groups[parent]
+
+        # Locals: this loop runs once per inserted row. Rows go straight to
+        # the Tcl insert command, skipping Treeview.insert's option formatting
+        tree = self.results_tree
+        call, widget = tree.tk.call, tree._w
+        data = self.tree_item_data
+        needs_lazy_load = self._needs_lazy_load
+        item_ids = []
+        for display_text, item_type, result in rows[start:start + count]:
+            item_id = call(widget, 'insert', parent, 'end', '-text', display_text, '-tags', item_type)
+            data[item_id] = (item_type, result)
+            if item_type in ('saga', 'collection'):
+                # Add placeholder child to enable expansion
+                placeholder_id = call(widget, 'insert', item_id, 'end', '-text', "Cargando...", '-tags', 'loading')
+                data[placeholder_id] = ('loading', None)  # Store placeholder
+                needs_lazy_load.add(item_id)
+            item_ids.append(item_id)
+        return item_ids
+
+    def _on_results_yscroll(self, first, last):
+        '''yscrollcommand of the results tree: near the end, add more rows'''
+        self._results_scrollbar.set(first, last)
+        if float(last) > 0.9 and self._pending_groups and not self._more_rows_scheduled:
+            self._more_rows_scheduled = True
+            self.after_idle(self._populate_more_results)
+
+    def _populate_more_results(self):
+        '''Insert the next batch of rows into every open, partially filled group'''
+        self._more_rows_scheduled = False
+        if not self.winfo_exists():
+            return
+        for parent, (rows, start) in list(self._pending_groups.items()):
+            if start and self.results_tree.item(parent, 'open'):
+                self._populate_result_group(parent)
+
     def _on_tree_expand(self, event):
         '''Handle tree item expansion - load children (collections/issues) for sagas/collections'''
         # Tk sets focus to the opened item for <<TreeviewOpen>>
         tree = event.widget if hasattr(event, 'widget') else self.results_tree
         item_id = tree.focus()
+        if item_id in self._pending_groups:
+            # A results header opened for the first time
+            if self._pending_groups[item_id][1] == 0:
+                self._populate_result_group(item_id)
+            return
         if not item_id or item_id not in self.tree_item_data:
             return
         item_type, item_obj = self.tree_item_data[item_id]
-        # Check loading flag to prevent concurrent loads
-        if hasattr(item_obj, '_loading') and item_obj._loading:
-            return
-        if item_type == 'header':
-            return
         if item_type not in ('collection', 'saga'):
             return
-        item_obj._loading = True
-        children = tree.get_children(item_id)
-        has_loading_placeholder = any(
-            tree.item(c, 'text') == "Cargando..." or self.tree_item_data.get(c, (None, None))[0] == 'loading'
-            for c in children
-        )
-        if children and not has_loading_placeholder:
-            item_obj._loading = False
+        # Only the first expansion loads; this also prevents concurrent loads
+        if item_id not in self._needs_lazy_load:
             return
-        for child in children:
-            if tree.item(child, 'text') == "Cargando..." or self.tree_item_data.get(child, (None, None))[0] == 'loading':
-                tree.delete(child)
-                self.tree_item_data.pop(child, None)
+        self._needs_lazy_load.discard(item_id)
+        item_obj._loading = True
+        placeholders = tree.get_children(item_id)
+        tree.delete(*placeholders)
+        for child in placeholders:
+            self.tree_item_data.pop(child, None)
         def load_children():
             try:
                 if not hasattr(item_obj, 'series_key'):
@@ -2880,19 +4001,22 @@ class SearchDialog(ctk.CTkToplevel):
                 collections = children_data.get('collections', [])
                 issues = children_data.get('issues', [])
                 def update_tree():
+                    insert = tree.insert
+                    data = self.tree_item_data
                     for collection in collections:
                         display_text = f"📚 {collection.series_name_s}"
-                        child_id = tree.insert(item_id, 'end', text=display_text, tags=('collection',))
-                        placeholder_id = tree.insert(child_id, 'end', text="Cargando...", tags=('loading',))
-                        self.tree_item_data[child_id] = ('collection', collection)
-                        self.tree_item_data[placeholder_id] = ('loading', None)
+                        child_id = insert(item_id, 'end', text=display_text, tags=('collection',))
+                        placeholder_id = insert(child_id, 'end', text="Cargando...", tags=('loading',))
+                        data[child_id] = ('collection', collection)
+                        data[placeholder_id] = ('loading', None)
+                        self._needs_lazy_load.add(child_id)
                     for issue in issues:
                         display_text = f"#{issue.issue_num_s} - {issue.title_s}"
-                        child_id = tree.insert(item_id, 'end', text=display_text, tags=('issue_item',))
-                        self.tree_item_data[child_id] = ('issue_item', issue)
+                        child_id = insert(item_id, 'end', text=display_text, tags=('issue_item',))
+                        data[child_id] = ('issue_item', issue)
                     if not collections and not issues:
-                        empty_id = tree.insert(item_id, 'end', text="Sin contenido", tags=('empty',))
-                        self.tree_item_data[empty_id] = ('empty', None)
+                        empty_id = insert(item_id, 'end', text="Sin contenido", tags=('empty',))
+                        data[empty_id] = ('empty', None)
                     item_obj._loading = False
                 self.after(0, update_tree)
             except Exception as e:
@@ -2901,8 +4025,7 @@ class SearchDialog(ctk.CTkToplevel):
                     self.tree_item_data[err_id] = ('empty', None)
                     item_obj._loading = False
                 self.after(0, show_error)
-        t = threading.Thread(target=load_children, daemon=True)
-        t.start()
+        self._run_in_background(load_children)
         
         if not item_id:
             return
@@ -3044,23 +4167,126 @@ class SearchDialog(ctk.CTkToplevel):
                 
                 self.after(0, show_error)
         
-        thread = threading.Thread(target=load_children)
-        thread.daemon = True
-        thread.start()
+        self._run_in_background(load_children)
 
-    def _show_series_preview(self, series_ref):
-        '''Show preview of selected series'''
-        # Clear previous preview
+    def _show_preview_message(self, text, fill='gray40'):
+        '''Replace the cover preview with a centred message'''
         self.preview_canvas.delete("all")
         self.preview_canvas.create_text(
             self.preview_canvas.winfo_width() // 2 if self.preview_canvas.winfo_width() > 10 else 200,
             self.preview_canvas.winfo_height() // 2 if self.preview_canvas.winfo_height() > 10 else 300,
-            text='Cargando portada...',
-            font=('Arial', 12), fill='gray40'
+            text=text,
+            font=('Arial', 12), fill=fill
         )
+
+    @classmethod
+    def _get_preview_pool(cls):
+        '''Small thread pool for preview covers, kept apart from comparison downloads'''
+        with cls._download_pool_lock:
+            if cls._preview_pool is None:
+                cls._preview_pool = ThreadPoolExecutor(max_workers=2)
+            return cls._preview_pool
+
+    @classmethod
+    def _get_task_pool(cls):
+        '''Persistent workers for the dialogs' background operations (created on first use)'''
+        with cls._download_pool_lock:
+            if cls._task_pool is None:
+                cls._task_pool = ThreadPoolExecutor(max_workers=4)
+            return cls._task_pool
+
+    def _run_in_background(self, fn):
+        '''Run fn on the shared task pool rather than on a thread of its own'''
+        self._get_task_pool().submit(fn).add_done_callback(self._report_background_error)
+
+    def _report_background_error(self, future):
+        '''Log an exception that escaped a _run_in_background function'''
+        error = future.exception()
+        if error is not None:
+            self._log(f"❌ Error en segundo plano: {error}")
+
+    def _preview_canvas_size(self):
+        '''Current preview canvas size, with defaults while it is not laid out yet'''
+        width = self.preview_canvas.winfo_width()
+        height = self.preview_canvas.winfo_height()
+        return (width if width >= 10 else 300, height if height >= 10 else 450)
+
+    def _load_preview(self, ref):
+        '''
+        Show ref's cover: at once if it was recently shown at this canvas
+        size, else show "Cargando portada..." and, once the selection has
+        settled for PREVIEW_DEBOUNCE_MS, fetch and decode it on the preview
+        pool. A preview still waiting in the pool is cancelled when another
+        one is requested.
+        '''
+        self._preview_gen += 1
+        if self._preview_future is not None:
+            self._preview_future.cancel()
+        if self._preview_after_id is not None:
+            self.after_cancel(self._preview_after_id)
+            self._preview_after_id = None
+
+        # Canvas size read here: Tk must not be queried from the worker
+        size = self._preview_canvas_size()
+        url = getattr(ref, 'extra_image_url', None) or getattr(ref, 'thumb_url_s', None)
+        photo = self._preview_photos.get((url, size))
+        if photo is not None:
+            self._preview_photos.move_to_end((url, size))
+            self._show_preview_photo(photo, size)
+            return
+
+        self._show_preview_message('Cargando portada...')
+        self._preview_after_id = self.after(
+            PREVIEW_DEBOUNCE_MS, self._submit_preview, ref, self._preview_gen, size, url)
+
+    def _submit_preview(self, ref, gen, size, url):
+        '''Start loading a preview requested by _load_preview, unless superseded'''
+        self._preview_after_id = None
+        if gen != self._preview_gen:
+            return
+        self._preview_future = self._get_preview_pool().submit(
+            self._load_preview_worker, ref, gen, size, url)
+
+    def _load_preview_worker(self, ref, gen, size, url):
+        '''Worker: fetch, decode and scale a preview cover, then display it on the UI thread'''
+        image = None
+        error = False
+        image_data = self._fetch_reference_image_data(ref)
+        if gen != self._preview_gen:
+            return  # another preview was requested meanwhile
+        if image_data:
+            try:
+                image = Image.open(BytesIO(image_data))
+                # JPEG covers are decoded at the smallest scale still at
+                # least as large as the canvas; it is downscaled anyway
+                image.draft('RGB', size)
+                image.load()
+                # Scaled here too, so the Tk thread only builds the PhotoImage
+                image = resize_image_for_preview(image, size)
+            except Exception:
+                image = None
+                error = True
+        self.after(0, lambda: self._show_preview_result(image, error, gen, size, url))
+
+    def _show_preview_result(self, image, error, gen, size, url):
+        '''Display a cover loaded by _load_preview_worker (or why there is none)'''
+        if gen != self._preview_gen:
+            return
+        if image is not None:
+            try:
+                self._display_preview_image(image, size, cache_url=url)
+                return
+            except Exception:
+                error = True
+        if error:
+            self._show_preview_message('Error mostrando portada', fill='red')
+        else:
+            self._show_preview_message('Sin portada disponible')
+
+    def _show_series_preview(self, series_ref):
+        '''Show preview of selected series'''
         self.metadata_display.config(state=tk.NORMAL)
         self.metadata_display.delete('1.0', tk.END)
-        self.update()
 
         # Show series info - distinguir tipo
         series_type = "📂 Saga/Colección" if hasattr(series_ref, 'series_type') and series_ref.series_type == 'collection' else "📚 Serie"
@@ -3073,49 +4299,11 @@ class SearchDialog(ctk.CTkToplevel):
         self.apply_xml_button.configure(state=tk.DISABLED)
 
         # Load cover in background
-        def load_cover():
-            image_data = self._fetch_reference_image_data(series_ref)
-            if image_data:
-                def show_cover():
-                    try:
-                        image = Image.open(BytesIO(image_data))
-                        self._display_preview_image(image)
-                    except Exception as e:
-                        self.preview_canvas.delete("all")
-                        self.preview_canvas.create_text(
-                            self.preview_canvas.winfo_width() // 2 if self.preview_canvas.winfo_width() > 10 else 200,
-                            self.preview_canvas.winfo_height() // 2 if self.preview_canvas.winfo_height() > 10 else 300,
-                            text='Error mostrando portada',
-                            font=('Arial', 12), fill='red'
-                        )
-                self.after(0, show_cover)
-            else:
-                def show_no_cover():
-                    self.preview_canvas.delete("all")
-                    self.preview_canvas.create_text(
-                        self.preview_canvas.winfo_width() // 2 if self.preview_canvas.winfo_width() > 10 else 200,
-                        self.preview_canvas.winfo_height() // 2 if self.preview_canvas.winfo_height() > 10 else 300,
-                        text='Sin portada disponible',
-                        font=('Arial', 12), fill='gray40'
-                    )
-                self.after(0, show_no_cover)
-
-        thread = threading.Thread(target=load_cover)
-        thread.daemon = True
-        thread.start()
+        self._load_preview(series_ref)
 
     def _show_issue_preview(self, issue_ref):
         '''Show preview of selected issue'''
-        # Clear previous preview
-        self.preview_canvas.delete("all")
-        self.preview_canvas.create_text(
-            self.preview_canvas.winfo_width() // 2 if self.preview_canvas.winfo_width() > 10 else 200,
-            self.preview_canvas.winfo_height() // 2 if self.preview_canvas.winfo_height() > 10 else 300,
-            text='Cargando portada...',
-            font=('Arial', 12), fill='gray40'
-        )
         self.info_text.delete('1.0', tk.END)
-        self.update()
 
         # Show issue info
         info = "📖 Issue\n"
@@ -3125,75 +4313,38 @@ class SearchDialog(ctk.CTkToplevel):
         self.info_text.insert('1.0', info)
 
         # Load cover in background
-        def load_cover():
-            image_data = self._fetch_reference_image_data(issue_ref)
-            if image_data:
-                def show_cover():
-                    try:
-                        image = Image.open(BytesIO(image_data))
-                        self._display_preview_image(image)
-                    except Exception as e:
-                        self.preview_canvas.delete("all")
-                        self.preview_canvas.create_text(
-                            self.preview_canvas.winfo_width() // 2 if self.preview_canvas.winfo_width() > 10 else 200,
-                            self.preview_canvas.winfo_height() // 2 if self.preview_canvas.winfo_height() > 10 else 300,
-                            text='Error mostrando portada',
-                            font=('Arial', 12), fill='red'
-                        )
-                self.after(0, show_cover)
-            else:
-                def show_no_cover():
-                    self.preview_canvas.delete("all")
-                    self.preview_canvas.create_text(
-                        self.preview_canvas.winfo_width() // 2 if self.preview_canvas.winfo_width() > 10 else 200,
-                        self.preview_canvas.winfo_height() // 2 if self.preview_canvas.winfo_height() > 10 else 300,
-                        text='Sin portada disponible',
-                        font=('Arial', 12), fill='gray40'
-                    )
-                self.after(0, show_no_cover)
-
-        thread = threading.Thread(target=load_cover)
-        thread.daemon = True
-        thread.start()
+        self._load_preview(issue_ref)
 
     def _show_issue_preview_with_metadata(self, issue_ref):
         '''Show preview of issue with full metadata'''
-        # Clear previous preview
-        self.preview_canvas.delete("all")
-        self.preview_canvas.create_text(
-            self.preview_canvas.winfo_width() // 2 if self.preview_canvas.winfo_width() > 10 else 200,
-            self.preview_canvas.winfo_height() // 2 if self.preview_canvas.winfo_height() > 10 else 300,
-            text='Cargando portada...',
-            font=('Arial', 12), fill='gray40'
-        )
         self.metadata_display.delete('1.0', tk.END)
         self.metadata_display.insert('1.0', 'Cargando metadatos...')
         self.apply_xml_button.configure(state=tk.DISABLED)
-        self.update()
-        
-        # Load cover and metadata in background
+
+        # Check if issue_ref is actually a SeriesRef with type='issue'
+        # If so, create a temporary IssueRef
+        from database.dbmodels import IssueRef, SeriesRef
+
+        actual_issue_ref = issue_ref
+        if isinstance(issue_ref, SeriesRef):
+            # It's a SeriesRef representing an individual issue
+            # Create a temporary IssueRef
+            actual_issue_ref = IssueRef(
+                issue_num_s="1",  # We don't have the real number yet
+                issue_key=issue_ref.series_key,  # Use series_key as issue_key
+                title_s=issue_ref.series_name_s,
+                thumb_url_s=getattr(issue_ref, 'thumb_url_s', None)
+            )
+            # Copy extra_image_url if exists
+            if hasattr(issue_ref, 'extra_image_url'):
+                actual_issue_ref.extra_image_url = issue_ref.extra_image_url
+
+        # The cover shows up as soon as it is loaded, without waiting for the metadata
+        self._load_preview(actual_issue_ref)
+        gen = self._preview_gen
+
+        # Load metadata in background
         def load_data():
-            # Check if issue_ref is actually a SeriesRef with type='issue'
-            # If so, create a temporary IssueRef
-            from database.dbmodels import IssueRef, SeriesRef
-            
-            actual_issue_ref = issue_ref
-            if isinstance(issue_ref, SeriesRef):
-                # It's a SeriesRef representing an individual issue
-                # Create a temporary IssueRef
-                actual_issue_ref = IssueRef(
-                    issue_num_s="1",  # We don't have the real number yet
-                    issue_key=issue_ref.series_key,  # Use series_key as issue_key
-                    title_s=issue_ref.series_name_s,
-                    thumb_url_s=getattr(issue_ref, 'thumb_url_s', None)
-                )
-                # Copy extra_image_url if exists
-                if hasattr(issue_ref, 'extra_image_url'):
-                    actual_issue_ref.extra_image_url = issue_ref.extra_image_url
-            
-            # Load cover
-            image_data = self._fetch_reference_image_data(actual_issue_ref)
-            
             # Save state before query to detect if HTTP request was made
             was_cached = False
             if hasattr(self.db, 'connection') and hasattr(self.db, 'cache') and self.db.cache:
@@ -3229,28 +4380,8 @@ class SearchDialog(ctk.CTkToplevel):
                     self._update_http_stats(from_cache=True)
             
             def update_ui():
-                # Show cover
-                if image_data:
-                    try:
-                        image = Image.open(BytesIO(image_data))
-                        self._display_preview_image(image)
-                    except Exception as e:
-                        self.preview_canvas.delete("all")
-                        self.preview_canvas.create_text(
-                            self.preview_canvas.winfo_width() // 2 if self.preview_canvas.winfo_width() > 10 else 200,
-                            self.preview_canvas.winfo_height() // 2 if self.preview_canvas.winfo_height() > 10 else 300,
-                            text='Error mostrando portada',
-                            font=('Arial', 12), fill='red'
-                        )
-                else:
-                    self.preview_canvas.delete("all")
-                    self.preview_canvas.create_text(
-                        self.preview_canvas.winfo_width() // 2 if self.preview_canvas.winfo_width() > 10 else 200,
-                        self.preview_canvas.winfo_height() // 2 if self.preview_canvas.winfo_height() > 10 else 300,
-                        text='Sin portada disponible',
-                        font=('Arial', 12), fill='gray40'
-                    )
-                
+                if gen != self._preview_gen:
+                    return  # the selection has moved on
                 # Show metadata
                 if issue:
                     # Convert to metadata dict (similar to main GUI)
@@ -3293,9 +4424,7 @@ class SearchDialog(ctk.CTkToplevel):
             
             self.after(0, update_ui)
         
-        thread = threading.Thread(target=load_data)
-        thread.daemon = True
-        thread.start()
+        self._run_in_background(load_data)
     
     def _issue_to_metadata_dict(self, issue):
         '''Convert Issue object to metadata dictionary with XML field names (Title, Series, etc.)'''
@@ -3335,40 +4464,9 @@ class SearchDialog(ctk.CTkToplevel):
             'OriginalTitle': issue.origin_title_s,
             'OriginalPublisher': issue.origin_publisher_s
         }
-        # Also create lowercase version for XML generation (ComicInfoGenerator expects lowercase)
-        metadata_lower = {
-            'title': issue.title_s,
-            'series': issue.series_name_s,
-            'number': issue.issue_num_s,
-            'count': issue.issue_count_n if issue.issue_count_n > 0 else None,
-            'volume': issue.volume_year_n if issue.volume_year_n > 0 else None,
-            'summary': issue.summary_s,
-            'publisher': issue.publisher_s,
-            'year': issue.pub_year_n if issue.pub_year_n > 0 else None,
-            'month': issue.pub_month_n if issue.pub_month_n > 0 else None,
-            'day': issue.pub_day_n if issue.pub_day_n > 0 else None,
-            'writer': issue.writers_sl,
-            'penciller': issue.pencillers_sl,
-            'inker': issue.inkers_sl,
-            'colorist': issue.colorists_sl,
-            'letterer': issue.letterers_sl,
-            'cover_artist': issue.cover_artists_sl,
-            'editor': issue.editors_sl,
-            'translator': issue.translators_sl,
-            'genre': ', '.join(issue.crossovers_sl) if issue.crossovers_sl else None,
-            'characters': ', '.join(issue.characters_sl) if issue.characters_sl else None,
-            'page_count': issue.page_count_n if issue.page_count_n > 0 else None,
-            'language_iso': 'es',
-            'format': issue.format_s,
-            'binding': issue.binding_s,
-            'dimensions': issue.dimensions_s,
-            'isbn': issue.isbn_s,
-            'legal_deposit': issue.legal_deposit_s,
-            'price': issue.price_s,
-            'original_title': issue.origin_title_s,
-            'original_publisher': issue.origin_publisher_s,
-            'web': issue.webpage_s
-        }
+        # Also create lowercase version for XML generation (ComicInfoGenerator expects lowercase),
+        # reusing the values computed above
+        metadata_lower = {lower: metadata[upper] for lower, upper in self._XML_DICT_KEYS}
         # Store both versions - use uppercase for display, lowercase for XML generation
         metadata['_xml_dict'] = metadata_lower
         return metadata
@@ -3433,27 +4531,36 @@ class SearchDialog(ctk.CTkToplevel):
         
         # Check if file is CBR and convert to CBZ first
         filepath = self.comic.filepath
-        if filepath.lower().endswith('.cbr'):
-            # Convert CBR to CBZ
-            if hasattr(self.parent, '_convert_cbr_to_cbz'):
-                try:
-                    self._log("🔄 Convirtiendo CBR a CBZ...")
-                    filepath = self.parent._convert_cbr_to_cbz(filepath)
-                    self.comic.filepath = filepath
-                    self.comic.filename = os.path.basename(filepath)
-                    self._log("✅ Conversión completada")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Error convirtiendo CBR a CBZ: {str(e)}")
-                    self._log(f"❌ Error en conversión: {str(e)}")
-                    return
+        if self.comic.ext == '.cbr':
+            # Convert CBR to CBZ in the background; injection continues in _on_cbr_converted
+            if hasattr(self.parent, '_convert_cbr_to_cbz_async'):
+                self._log("🔄 Convirtiendo CBR a CBZ...")
+                self.parent._convert_cbr_to_cbz_async(filepath, self._on_cbr_converted)
             else:
                 messagebox.showerror("Error", "No se puede acceder al método de conversión CBR a CBZ")
-                return
-        
+            return
+
+        self._inject_comicinfo(filepath)
+
+    def _on_cbr_converted(self, filepath):
+        '''Called on the UI thread when the parent has finished converting the CBR'''
+        if filepath:
+            self.comic.set_filepath(filepath)
+        if not self.winfo_exists():
+            return
+        if not filepath:
+            messagebox.showerror("Error", "Error convirtiendo CBR a CBZ")
+            self._log("❌ Error en conversión")
+            return
+        self._log("✅ Conversión completada")
+        self._inject_comicinfo(filepath)
+
+    def _inject_comicinfo(self, filepath):
+        '''Inject the current ComicInfo.xml into the (CBZ) comic file'''
         # Use parent's method to inject XML
-        if hasattr(self.parent, '_inject_xml'):
+        if hasattr(self.parent, '_inject_xml_now'):
             try:
-                self.parent._inject_xml(filepath, self.current_metadata_xml)
+                self.parent._inject_xml_now(filepath, self.current_metadata_xml)
                 messagebox.showinfo("Éxito", "ComicInfo.xml aplicado correctamente")
                 self._log("✅ ComicInfo.xml aplicado a: {}".format(self.comic.filename))
             except Exception as e:
@@ -3462,34 +4569,27 @@ class SearchDialog(ctk.CTkToplevel):
         else:
             messagebox.showerror("Error", "No se puede acceder al método de inyección de XML")
 
-    def _display_preview_image(self, image):
-        '''Display image in preview canvas, scaled to fit'''
-        # Get canvas actual size
-        self.preview_canvas.update_idletasks()
-        canvas_width = self.preview_canvas.winfo_width()
-        canvas_height = self.preview_canvas.winfo_height()
-        
-        # Use reasonable defaults if canvas not yet sized
-        if canvas_width < 10:
-            canvas_width = 300
-        if canvas_height < 10:
-            canvas_height = 450
-        
-        # Scale image to fit canvas while maintaining aspect ratio
-        img_width, img_height = image.size
-        width_ratio = canvas_width / img_width
-        height_ratio = canvas_height / img_height
-        scale = min(width_ratio, height_ratio)
-        
-        new_width = int(img_width * scale)
-        new_height = int(img_height * scale)
-        
-        display_img = image.resize((new_width, new_height), ANTIALIAS)
-        photo = ImageTk.PhotoImage(display_img)
+    def _display_preview_image(self, image, size, cache_url=None):
+        '''
+        Display an image already scaled to fit a canvas of the given size
+        (see _load_preview_worker). With cache_url the PhotoImage is kept
+        for _load_preview to reuse.
+        '''
+        # Only the PhotoImage has to be built on the Tk thread
+        photo = ImageTk.PhotoImage(image)
+        if cache_url:
+            self._preview_photos[(cache_url, size)] = photo
+            if len(self._preview_photos) > PREVIEW_PHOTO_CACHE_SIZE:
+                self._preview_photos.popitem(last=False)
+        self._show_preview_photo(photo, size)
+
+    def _show_preview_photo(self, photo, size):
+        '''Draw an already scaled preview centred in a canvas of the given size'''
+        canvas_width, canvas_height = size
         
         # Center image in canvas
-        x_offset = (canvas_width - new_width) // 2
-        y_offset = (canvas_height - new_height) // 2
+        x_offset = (canvas_width - photo.width()) // 2
+        y_offset = (canvas_height - photo.height()) // 2
         
         # Update label with image and position centered in canvas
         self.preview_label.config(image=photo)
@@ -3499,116 +4599,6 @@ class SearchDialog(ctk.CTkToplevel):
         self.preview_canvas.delete("all")
         self.preview_canvas.create_image(x_offset, y_offset, image=photo, anchor=tk.NW)
 
-    def _view_issues(self):
-        '''View issues for selected series'''
-        if not self.selected_series:
-            messagebox.showwarning("Advertencia", "Selecciona una serie primero")
-            return
-
-        self.mode = 'issues'
-        self.back_button.configure(state=tk.NORMAL)
-        self.results_label.config(text="Issues de '{0}':".format(self.selected_series.series_name_s))
-        self.select_button.configure(text="✓ Seleccionar Issue", command=self._select_issue)
-        self.selected_issue = None
-        self._update_open_buttons()
-
-        self.results_listbox.delete(0, tk.END)
-        self.results_listbox.insert(tk.END, "Cargando issues...")
-        self.status_label.configure(text="Obteniendo issues de la serie...")
-        self.update()
-
-        # Query issues in background
-        def query_issues():
-            issues = self.db.query_series_issues(self.selected_series)
-
-            def update_issues():
-                self.results_listbox.delete(0, tk.END)
-                self.issues_list = issues
-
-                if not issues:
-                    self.results_listbox.insert(tk.END, "Sin issues encontrados")
-                    self.status_label.configure(text="Sin issues")
-                    return
-
-                # Display issues first
-                for issue in issues:
-                    display_text = "#{0} - {1}".format(issue.issue_num_s, issue.title_s)
-                    self.results_listbox.insert(tk.END, display_text)
-
-                # Start image comparison if enabled and comic has a cover
-                if self.compare_covers and self.comic.cover_image:
-                    self.status_label.configure(text="{0} issues encontrados - Comparando portadas...".format(len(issues)))
-                    self._compare_covers_with_issues(issues)
-                else:
-                    if not self.compare_covers:
-                        self.status_label.configure(text="{0} issues encontrados (comparación deshabilitada)".format(len(issues)))
-                    else:
-                        self.status_label.configure(text="{0} issues encontrados".format(len(issues)))
-
-            self.after(0, update_issues)
-
-        thread = threading.Thread(target=query_issues)
-        thread.daemon = True
-        thread.start()
-
-    def _compare_covers_with_issues(self, issues):
-        '''Compare comic cover with issue covers'''
-        def compare_thread():
-            self.downloaded_images = []
-            self.similarity_scores = []
-
-            # Download all issue covers
-            for issue in issues:
-                try:
-                    image_data = self._fetch_reference_image_data(issue)
-                    if image_data:
-                        image = Image.open(BytesIO(image_data))
-                        self.downloaded_images.append(image)
-                    else:
-                        self.downloaded_images.append(None)
-                except:
-                    self.downloaded_images.append(None)
-
-            # Compare with comic cover
-            if self.comic.cover_image and self.downloaded_images:
-                self.best_match_index, self.similarity_scores = ImageComparator.find_best_match(
-                    self.comic.cover_image,
-                    self.downloaded_images
-                )
-
-                def update_ui():
-                    # Update listbox with scores
-                    self.results_listbox.delete(0, tk.END)
-                    for i, issue in enumerate(issues):
-                        score = self.similarity_scores[i] if i < len(self.similarity_scores) else 0
-                        prefix = "⭐ " if i == self.best_match_index and score > 60 else "   "
-                        display_text = "{0}#{1} - {2} ({3:.0f}% similar)".format(
-                            prefix, issue.issue_num_s, issue.title_s, score)
-                        self.results_listbox.insert(tk.END, display_text)
-
-                    # Auto-select best match if score is good enough
-                    if self.best_match_index >= 0 and self.similarity_scores[self.best_match_index] > 60:
-                        self.results_listbox.selection_clear(0, tk.END)
-                        self.results_listbox.selection_set(self.best_match_index)
-                        self.results_listbox.see(self.best_match_index)
-                        self.results_listbox.activate(self.best_match_index)
-                        # Trigger selection event
-                        self.selected_issue = self.issues_list[self.best_match_index]
-                        self._show_issue_preview(self.selected_issue)
-
-                        best_score = self.similarity_scores[self.best_match_index]
-                        self.status_label.configure(
-                            text="Mejor match encontrado: {0:.0f}% similar (⭐ marcado)".format(best_score)
-                        )
-                    else:
-                        self.status_label.configure(text="{0} issues encontrados".format(len(issues)))
-
-                self.after(0, update_ui)
-
-        thread = threading.Thread(target=compare_thread)
-        thread.daemon = True
-        thread.start()
-
     def _view_single_issue(self):
         '''View a single issue (when the search result IS an issue)'''
         if not self.selected_series:
@@ -3640,36 +4630,6 @@ class SearchDialog(ctk.CTkToplevel):
         self.selected_issue = issue_ref
         self._select_issue()
 
-    def _back_to_series(self):
-        '''Go back to series search results'''
-        self.mode = 'series'
-        self.back_button.configure(state=tk.DISABLED)
-        self.results_label.config(text="Series encontradas:")
-        self.select_button.configure(text="Ver Issues →", command=self._view_issues)
-        self.selected_issue = None
-        self._update_open_buttons()
-
-        # Restore series list with scores if available
-        self.results_listbox.delete(0, tk.END)
-        for i, result in enumerate(self.search_results):
-            if i < len(self.similarity_scores):
-                score = self.similarity_scores[i]
-                prefix = "⭐ " if i == self.best_match_index and score > 60 else "   "
-                display_text = "{0}{1} ({2:.0f}% similar)".format(prefix, result.series_name_s, score)
-            else:
-                display_text = result.series_name_s
-            self.results_listbox.insert(tk.END, display_text)
-
-        if self.best_match_index >= 0 and self.best_match_index < len(self.similarity_scores):
-            best_score = self.similarity_scores[self.best_match_index]
-            self.status_label.configure(text="{0} series encontradas - Mejor match: {1:.0f}% similar".format(
-                len(self.search_results), best_score))
-        else:
-            self.status_label.configure(text="{0} series encontradas".format(len(self.search_results)))
-            
-        # Update preview label size info
-        self.preview_label.config(text="Selecciona un resultado para ver su portada\n(Vista previa ampliada)")
-
     def _select_issue(self):
         '''Select issue and fetch full metadata'''
         if not self.selected_issue:
@@ -3677,7 +4637,6 @@ class SearchDialog(ctk.CTkToplevel):
             return
 
         self.status_label.configure(text="Obteniendo metadatos completos...")
-        self.update()
 
         # Query full issue details in background
         def query_details():
@@ -3732,9 +4691,7 @@ class SearchDialog(ctk.CTkToplevel):
 
             self.after(0, complete_selection)
 
-        thread = threading.Thread(target=query_details)
-        thread.daemon = True
-        thread.start()
+        self._run_in_background(query_details)
 
 
 class BatchSearchDialog(SearchDialog):
@@ -3747,8 +4704,10 @@ class BatchSearchDialog(SearchDialog):
     def destroy(self):
         '''Override destroy to call callback'''
         SearchDialog.destroy(self)
-        if self.on_close_callback:
-            self.on_close_callback()
+        # The batch continues from this callback: make sure it only runs once
+        callback, self.on_close_callback = self.on_close_callback, None
+        if callback:
+            callback()
 
     def _select_issue(self):
         '''Override to auto-close after selection'''
@@ -3757,7 +4716,6 @@ class BatchSearchDialog(SearchDialog):
             return
 
         self.status_label.configure(text="Obteniendo metadatos completos...")
-        self.update()
 
         # Query full issue details in background
         def query_details():
@@ -3810,9 +4768,7 @@ class BatchSearchDialog(SearchDialog):
 
             self.after(0, complete_selection)
 
-        thread = threading.Thread(target=query_details)
-        thread.daemon = True
-        thread.start()
+        self._run_in_background(query_details)
 
 
 def main():
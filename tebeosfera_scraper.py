@@ -40,6 +40,9 @@ except ImportError as e:
 class TebeoSferaScraper(object):
     '''Main scraper class'''
 
+    # Page formats that are already compressed: deflating them again only costs CPU
+    STORED_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+
     def __init__(self, show_covers=True):
         '''Initialize the scraper'''
         self.db = TebeoSferaDB()
@@ -312,9 +315,10 @@ class TebeoSferaScraper(object):
         if not xml_content:
             return False
 
-        # Create temporary directory
-        temp_dir = tempfile.mkdtemp()
-        temp_cbz = os.path.join(temp_dir, 'temp.cbz')
+        # Create the temporary file next to the CBZ, so replacing the original
+        # is a rename rather than a copy from the system temp directory
+        fd, temp_cbz = tempfile.mkstemp(suffix='.cbz', dir=os.path.dirname(os.path.abspath(cbz_path)))
+        os.close(fd)
 
         try:
             # Extract existing CBZ
@@ -324,13 +328,17 @@ class TebeoSferaScraper(object):
                     for item in zip_in.infolist():
                         if item.filename != 'ComicInfo.xml':
                             data = zip_in.read(item.filename)
-                            zip_out.writestr(item, data)
+                            if item.filename.lower().endswith(self.STORED_EXTENSIONS):
+                                zip_out.writestr(item, data, compress_type=zipfile.ZIP_STORED)
+                            else:
+                                zip_out.writestr(item, data)
 
                     # Add new ComicInfo.xml
                     zip_out.writestr('ComicInfo.xml', xml_content.encode('utf-8'))
 
-            # Replace original file
-            shutil.move(temp_cbz, cbz_path)
+            # Replace original file (atomically, keeping its permissions)
+            shutil.copymode(cbz_path, temp_cbz)
+            os.replace(temp_cbz, cbz_path)
             print("SUCCESS: ComicInfo.xml injected into {0}".format(cbz_path))
             return True
 
@@ -339,11 +347,12 @@ class TebeoSferaScraper(object):
             return False
 
         finally:
-            # Clean up temp directory
-            try:
-                shutil.rmtree(temp_dir)
-            except:
-                pass
+            # Clean up temp file if it is still there
+            if os.path.exists(temp_cbz):
+                try:
+                    os.remove(temp_cbz)
+                except OSError:
+                    pass
 
     def show_series_covers(self, series_list, interactive=False):
         '''
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Test ComicInfo.xml injection into CBZ files and the local cover cache:
+- In-place append when ComicInfo.xml is absent or the last entry
+- Full repack (raw entry copy) when ComicInfo.xml sits in the middle
+- Stored, deflated, data-descriptor and ZIP64-extra entries survive both paths
+- Non-ZIP files are left untouched by the in-place path
+- Cover cache round trip and invalidation by mtime/size
+'''
+
+import sys
+import os
+import io
+import shutil
+import sqlite3
+import struct
+import tempfile
+import zipfile
+from types import SimpleNamespace
+
+# Add repo root and src/py to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'py'))
+
+from PIL import Image
+
+from tebeosfera_gui import TebeoSferaGUI, _strip_zip64_extra
+from cover_cache import CoverCache
+
+
+OLD_XML = b'<?xml version="1.0"?><ComicInfo><Title>Old</Title></ComicInfo>'
+NEW_XML = '<?xml version="1.0"?><ComicInfo><Title>Nuevo título</Title></ComicInfo>'
+
+# Page contents: one incompressible, one very compressible
+PAGES = {
+    'page001.jpg': bytes((i * 7919 + i // 3) % 256 for i in range(40000)),
+    'page002.jpg': b'tebeosfera ' * 5000,
+}
+
+
+class _Unseekable(io.RawIOBase):
+    '''Write-only stream without tell(): zipfile falls back to data descriptors'''
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return self.buffer.write(data)
+
+
+def _write_entry(zf, name, data, kind):
+    '''Add one entry of the given kind (stored, deflated, descriptor, zip64)'''
+    compress_type = zipfile.ZIP_STORED if kind == 'stored' else zipfile.ZIP_DEFLATED
+    info = zipfile.ZipInfo(name, date_time=(2020, 1, 1, 0, 0, 0))
+    info.compress_type = compress_type
+    # force_zip64 writes a ZIP64 record in the local header extra field
+    with zf.open(info, 'w', force_zip64=(kind == 'zip64')) as f:
+        f.write(data)
+
+
+def _build_cbz(path, kind, comicinfo=None):
+    '''
+    Write a CBZ with PAGES; comicinfo is None (absent), 'last' or 'middle'
+    '''
+    names = list(PAGES)
+    if comicinfo == 'last':
+        names.append('ComicInfo.xml')
+    elif comicinfo == 'middle':
+        names.insert(1, 'ComicInfo.xml')
+
+    stream = _Unseekable() if kind == 'descriptor' else io.BytesIO()
+    with zipfile.ZipFile(stream, 'w') as zf:
+        for name in names:
+            data = OLD_XML if name == 'ComicInfo.xml' else PAGES[name]
+            _write_entry(zf, name, data, kind)
+    buffer = stream.buffer if kind == 'descriptor' else stream
+    with open(path, 'wb') as f:
+        f.write(buffer.getvalue())
+
+
+def _inject(path, xml):
+    '''Run TebeoSferaGUI._inject_xml without a window'''
+    stub = SimpleNamespace(
+        _log=lambda msg: None,
+        _append_comicinfo=TebeoSferaGUI._append_comicinfo,
+    )
+    stub._repack_with_comicinfo = lambda p, x: TebeoSferaGUI._repack_with_comicinfo(stub, p, x)
+    TebeoSferaGUI._inject_xml(stub, path, xml)
+
+
+def _check_cbz(path, kind):
+    '''The archive is valid, pages are intact and ComicInfo.xml is the new one'''
+    with zipfile.ZipFile(path) as zf:
+        assert zf.testzip() is None
+        names = zf.namelist()
+        assert names.count('ComicInfo.xml') == 1
+        assert zf.read('ComicInfo.xml') == NEW_XML.encode('utf-8')
+        assert zf.getinfo('ComicInfo.xml').compress_type == zipfile.ZIP_STORED
+        for name, data in PAGES.items():
+            assert zf.read(name) == data, f"{kind}: {name} changed"
+            expected = zipfile.ZIP_STORED if kind == 'stored' else zipfile.ZIP_DEFLATED
+            assert zf.getinfo(name).compress_type == expected
+
+
+def _run_case(kind, comicinfo):
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, 'comic.cbz')
+        _build_cbz(path, kind, comicinfo)
+        if kind == 'descriptor':
+            with zipfile.ZipFile(path) as zf:
+                assert all(info.flag_bits & 0x08 for info in zf.infolist())
+        _inject(path, NEW_XML)
+        _check_cbz(path, kind)
+        # Injecting again (ComicInfo.xml is now last) replaces it in place
+        assert TebeoSferaGUI._append_comicinfo(path, NEW_XML.encode('utf-8'))
+        _check_cbz(path, kind)
+        # Nothing left behind by the repack
+        assert os.listdir(temp_dir) == ['comic.cbz']
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_append_without_comicinfo():
+    '''ComicInfo.xml absent: appended in place'''
+    for kind in ('stored', 'deflated', 'descriptor', 'zip64'):
+        _run_case(kind, None)
+
+
+def test_append_replaces_last_comicinfo():
+    '''ComicInfo.xml is the last entry: replaced in place'''
+    for kind in ('stored', 'deflated', 'descriptor', 'zip64'):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, 'comic.cbz')
+            _build_cbz(path, kind, 'last')
+            assert TebeoSferaGUI._append_comicinfo(path, NEW_XML.encode('utf-8'))
+            _check_cbz(path, kind)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        _run_case(kind, 'last')
+
+
+def test_repack_when_comicinfo_in_middle():
+    '''ComicInfo.xml before other entries: the in-place path declines, repack copies raw'''
+    for kind in ('stored', 'deflated', 'descriptor', 'zip64'):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, 'comic.cbz')
+            _build_cbz(path, kind, 'middle')
+            with open(path, 'rb') as f:
+                before = f.read()
+            assert not TebeoSferaGUI._append_comicinfo(path, NEW_XML.encode('utf-8'))
+            with open(path, 'rb') as f:
+                assert f.read() == before
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        _run_case(kind, 'middle')
+
+
+def test_non_zip_is_untouched():
+    '''A file that isn't a ZIP is not appended to'''
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, 'comic.cbz')
+        data = b'Rar!\x1a\x07\x00' + b'\x00' * 100
+        with open(path, 'wb') as f:
+            f.write(data)
+        assert not TebeoSferaGUI._append_comicinfo(path, NEW_XML.encode('utf-8'))
+        with open(path, 'rb') as f:
+            assert f.read() == data
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_strip_zip64_extra():
+    '''Only ZIP64 records (id 0x0001) are dropped from an extra field'''
+    zip64 = struct.pack('<HHQQ', 0x0001, 16, 1, 2)
+    timestamp = struct.pack('<HHB', 0x5455, 1, 3)
+    unicode_path = struct.pack('<HH', 0x7075, 3) + b'abc'
+    assert _strip_zip64_extra(zip64) == b''
+    assert _strip_zip64_extra(timestamp + zip64 + unicode_path) == timestamp + unicode_path
+    assert _strip_zip64_extra(b'') == b''
+
+
+def _make_cover(path, size=(600, 900), color=(200, 30, 30)):
+    '''Write a dummy comic file (contents only matter for mtime/size)'''
+    with open(path, 'wb') as f:
+        f.write(b'x' * 1000)
+    return Image.new('RGB', size, color)
+
+
+def test_cover_cache_round_trip():
+    '''Stored covers come back as thumbnails with their dhash'''
+    temp_dir = tempfile.mkdtemp()
+    try:
+        cache = CoverCache(cache_dir=temp_dir)
+        path = os.path.join(temp_dir, 'comic.cbz')
+        image = _make_cover(path)
+        assert cache.get_cover(path) is None
+
+        dhash = (1 << 64) - 12345  # Above the signed 64-bit range of SQLite
+        thumbnail = cache.store_cover(path, image, dhash, max_size=(100, 150))
+        assert thumbnail.size == (100, 150)
+
+        cached, cached_hash = cache.get_cover(path)
+        assert cached.size == (100, 150)
+        assert cached.getpixel((50, 75)) == (200, 30, 30)
+        assert cached_hash == dhash
+
+        # A cover without a hash is stored too
+        cache.store_cover(path, image)
+        assert cache.get_cover(path)[1] is None
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_cover_cache_invalidation():
+    '''Modifying the file invalidates its entry and replaces the old row'''
+    temp_dir = tempfile.mkdtemp()
+    try:
+        cache = CoverCache(cache_dir=temp_dir)
+        path = os.path.join(temp_dir, 'comic.cbz')
+        image = _make_cover(path)
+        cache.store_cover(path, image, 42)
+        assert cache.get_cover(path) is not None
+
+        with open(path, 'ab') as f:
+            f.write(b'more pages')
+        assert cache.get_cover(path) is None
+
+        cache.store_cover(path, image, 43)
+        assert cache.get_cover(path)[1] == 43
+        conn = sqlite3.connect(cache.db_path)
+        try:
+            rows = conn.execute('SELECT COUNT(*) FROM covers').fetchone()[0]
+        finally:
+            conn.close()
+        assert rows == 1
+
+        # Missing files have no key and are never cached
+        missing = os.path.join(temp_dir, 'missing.cbz')
+        assert cache.store_cover(missing, image) is None
+        assert cache.get_cover(missing) is None
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    print("CBZ ComicInfo.xml injection and cover cache tests\n")
+    tests = [
+        test_append_without_comicinfo,
+        test_append_replaces_last_comicinfo,
+        test_repack_when_comicinfo_in_middle,
+        test_non_zip_is_untouched,
+        test_strip_zip64_extra,
+        test_cover_cache_round_trip,
+        test_cover_cache_invalidation,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    print("\n" + "=" * 80)
+    if failed:
+        print(f"❌ {failed} TEST(S) FAILED")
+        sys.exit(1)
+    print("✅ ALL TESTS PASSED")
+    sys.exit(0)